@@ -103,6 +103,16 @@ class AgentBase(Generic[TContext]):
 
     async def get_all_tools(self, run_context: RunContextWrapper[Any]) -> list[Tool]:
         """All agent tools, including MCP tools and function tools."""
+        # Fast path: with no MCP servers to query and only statically enabled/disabled
+        # tools, there is nothing async to resolve.
+        if not self.mcp_servers and all(
+            not isinstance(tool, FunctionTool) or isinstance(tool.is_enabled, bool)
+            for tool in self.tools
+        ):
+            return [
+                tool for tool in self.tools if not isinstance(tool, FunctionTool) or tool.is_enabled
+            ]
+
         mcp_tools = await self.get_mcp_tools(run_context)
 
         async def _check_tool_enabled(tool: Tool) -> bool:
@@ -221,6 +231,11 @@ class Agent(AgentBase, Generic[TContext]):
     """Whether to reset the tool choice to the default value after a tool has been called. Defaults
     to True. This ensures that the agent doesn't enter an infinite loop of tool usage."""
 
+    _cached_output_schema: tuple[Any, AgentOutputSchemaBase | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Output schema built from `output_type`, cached alongside the type it was built from."""
+
     def clone(self, **kwargs: Any) -> Agent[TContext]:
         """Make a copy of the agent, with the given arguments changed. For example, you could do:
         ```
@@ -299,6 +314,16 @@ class Agent(AgentBase, Generic[TContext]):
 
     async def get_all_tools(self, run_context: RunContextWrapper[Any]) -> list[Tool]:
         """All agent tools, including MCP tools and function tools."""
+        # Fast path: with no MCP servers to query and only statically enabled/disabled
+        # tools, there is nothing async to resolve.
+        if not self.mcp_servers and all(
+            not isinstance(tool, FunctionTool) or isinstance(tool.is_enabled, bool)
+            for tool in self.tools
+        ):
+            return [
+                tool for tool in self.tools if not isinstance(tool, FunctionTool) or tool.is_enabled
+            ]
+
         mcp_tools = await self.get_mcp_tools(run_context)
 
         async def _check_tool_enabled(tool: Tool) -> bool:
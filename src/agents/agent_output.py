@@ -87,9 +87,11 @@ class AgentOutputSchema(AgentOutputSchemaBase):
         self._strict_json_schema = strict_json_schema
 
         if output_type is None or output_type is str:
+            # Plain text output: `json_schema()` raises for plain text, so there's no need to
+            # generate a schema at all.
             self._is_wrapped = False
             self._type_adapter = TypeAdapter(output_type)
-            self._output_schema = self._type_adapter.json_schema()
+            self._output_schema = {}
             return
 
         # We should wrap for things that are not plain text, and for things that would definitely
@@ -5,12 +5,28 @@ import json
 import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from ..items import TResponseInputItem
 
+# orjson (de)serializes several times faster than the stdlib and emits bytes directly,
+# which sqlite3 stores as-is; its JSONDecodeError subclasses json.JSONDecodeError, so the
+# corrupted-row handling below works for either codec.
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 @runtime_checkable
 class Session(Protocol):
@@ -104,6 +120,25 @@ class SessionABC(ABC):
         ...
 
 
+# Tuning pragmas applied to every new connection. WAL lets readers proceed alongside the
+# writer, and synchronous=NORMAL defers fsyncs to WAL checkpoints instead of every commit;
+# the rest keep temp structures and hot pages in memory. All of these except journal_mode
+# are per-connection settings, so they are applied at connect time rather than once per
+# database.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-8000;
+    PRAGMA busy_timeout=5000;
+"""
+
+# Rows per multi-row INSERT statement. Each row binds two parameters, and older SQLite
+# builds cap a statement at 999 bound parameters, so stay comfortably below that.
+_INSERT_CHUNK_ROWS = 400
+
+
 class SQLiteSession(SessionABC):
     """SQLite-based implementation of session storage.
 
@@ -123,7 +158,8 @@ class SQLiteSession(SessionABC):
 
         Args:
             session_id: Unique identifier for the conversation session
-            db_path: Path to the SQLite database file. Defaults to ':memory:' (in-memory database)
+            db_path: Path to the SQLite database file, or a 'file:' URI (e.g. a shared-cache
+                in-memory database). Defaults to ':memory:' (in-memory database)
             sessions_table: Name of the table to store session metadata. Defaults to
                 'agent_sessions'
             messages_table: Name of the table to store message data. Defaults to 'agent_messages'
@@ -134,18 +170,31 @@ class SQLiteSession(SessionABC):
         self.messages_table = messages_table
         self._local = threading.local()
         self._lock = threading.Lock()
+        # All writes funnel through one long-lived thread: SQLite allows a single writer
+        # at a time anyway, so racing asyncio.to_thread workers against the write lock
+        # just adds contention, and the pinned thread reuses its connection across calls.
+        self._write_executor = ThreadPoolExecutor(max_workers=1)
+        self._closed = False
 
         # For in-memory databases, we need a shared connection to avoid thread isolation
         # For file databases, we use thread-local connections for better concurrency
-        self._is_memory_db = str(db_path) == ":memory:"
+        db_path_str = str(db_path)
+        self._is_uri = db_path_str.startswith("file:")
+        self._is_memory_db = db_path_str == ":memory:" or (
+            self._is_uri and "mode=memory" in db_path_str
+        )
         if self._is_memory_db:
-            self._shared_connection = sqlite3.connect(":memory:", check_same_thread=False)
-            self._shared_connection.execute("PRAGMA journal_mode=WAL")
+            self._shared_connection = sqlite3.connect(
+                db_path_str, check_same_thread=False, uri=self._is_uri, cached_statements=256
+            )
+            self._shared_connection.executescript(_CONNECTION_PRAGMAS)
             self._init_db_for_connection(self._shared_connection)
         else:
             # For file databases, initialize the schema once since it persists
-            init_conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            init_conn.execute("PRAGMA journal_mode=WAL")
+            init_conn = sqlite3.connect(
+                db_path_str, check_same_thread=False, uri=self._is_uri, cached_statements=256
+            )
+            init_conn.executescript(_CONNECTION_PRAGMAS)
             self._init_db_for_connection(init_conn)
             init_conn.close()
 
@@ -160,8 +209,10 @@ class SQLiteSession(SessionABC):
                 self._local.connection = sqlite3.connect(
                     str(self.db_path),
                     check_same_thread=False,
+                    uri=self._is_uri,
+                    cached_statements=256,
                 )
-                self._local.connection.execute("PRAGMA journal_mode=WAL")
+                self._local.connection.executescript(_CONNECTION_PRAGMAS)
             assert isinstance(self._local.connection, sqlite3.Connection), (
                 f"Expected sqlite3.Connection, got {type(self._local.connection)}"
             )
@@ -199,6 +250,16 @@ class SQLiteSession(SessionABC):
         """
         )
 
+        # Serves the newest-first queries in get_items(limit=...) and pop_item with an
+        # index seek rather than a scan; id ordering also breaks ties that created_at's
+        # one-second resolution cannot.
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{self.messages_table}_session_id_id
+            ON {self.messages_table} (session_id, id DESC)
+        """
+        )
+
         conn.commit()
 
     async def get_items(self, limit: int | None = None) -> list[TResponseInputItem]:
@@ -221,7 +282,7 @@ class SQLiteSession(SessionABC):
                         f"""
                         SELECT message_data FROM {self.messages_table}
                         WHERE session_id = ?
-                        ORDER BY created_at ASC
+                        ORDER BY id ASC
                     """,
                         (self.session_id,),
                     )
@@ -231,22 +292,30 @@ class SQLiteSession(SessionABC):
                         f"""
                         SELECT message_data FROM {self.messages_table}
                         WHERE session_id = ?
-                        ORDER BY created_at DESC
+                        ORDER BY id DESC
                         LIMIT ?
                         """,
                         (self.session_id, limit),
                     )
 
-                rows = cursor.fetchall()
+                # Stream rows in fixed-size batches rather than materializing the whole
+                # result set in one fetchall() allocation.
+                cursor.arraysize = 256
+                rows: list[tuple[str]] = []
+                while True:
+                    batch = cursor.fetchmany()
+                    if not batch:
+                        break
+                    rows.extend(batch)
 
                 # Reverse to get chronological order when using DESC
                 if limit is not None:
-                    rows = list(reversed(rows))
+                    rows.reverse()
 
                 items = []
                 for (message_data,) in rows:
                     try:
-                        item = json.loads(message_data)
+                        item = _json_loads(message_data)
                         items.append(item)
                     except json.JSONDecodeError:
                         # Skip invalid JSON entries
@@ -277,14 +346,15 @@ class SQLiteSession(SessionABC):
                     (self.session_id,),
                 )
 
-                # Add items
-                message_data = [(self.session_id, json.dumps(item)) for item in items]
-                conn.executemany(
-                    f"""
-                    INSERT INTO {self.messages_table} (session_id, message_data) VALUES (?, ?)
-                """,
-                    message_data,
-                )
+                # Add items. A multi-row VALUES clause inserts each chunk in a single
+                # statement, instead of stepping the insert once per row.
+                message_data = [(self.session_id, _json_dumps(item)) for item in items]
+                insert_sql = f"INSERT INTO {self.messages_table} (session_id, message_data) VALUES "
+                for i in range(0, len(message_data), _INSERT_CHUNK_ROWS):
+                    chunk = message_data[i : i + _INSERT_CHUNK_ROWS]
+                    placeholders = ",".join(["(?, ?)"] * len(chunk))
+                    params = [value for row in chunk for value in row]
+                    conn.execute(insert_sql + placeholders, params)
 
                 # Update session timestamp
                 conn.execute(
@@ -298,7 +368,7 @@ class SQLiteSession(SessionABC):
 
                 conn.commit()
 
-        await asyncio.to_thread(_add_items_sync)
+        await asyncio.get_running_loop().run_in_executor(self._write_executor, _add_items_sync)
 
     async def pop_item(self) -> TResponseInputItem | None:
         """Remove and return the most recent item from the session.
@@ -317,7 +387,7 @@ class SQLiteSession(SessionABC):
                     WHERE id = (
                         SELECT id FROM {self.messages_table}
                         WHERE session_id = ?
-                        ORDER BY created_at DESC
+                        ORDER BY id DESC
                         LIMIT 1
                     )
                     RETURNING message_data
@@ -331,7 +401,7 @@ class SQLiteSession(SessionABC):
                 if result:
                     message_data = result[0]
                     try:
-                        item = json.loads(message_data)
+                        item = _json_loads(message_data)
                         return item
                     except json.JSONDecodeError:
                         # Return None for corrupted JSON entries (already deleted)
@@ -339,7 +409,9 @@ class SQLiteSession(SessionABC):
 
                 return None
 
-        return await asyncio.to_thread(_pop_item_sync)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._write_executor, _pop_item_sync
+        )
 
     async def clear_session(self) -> None:
         """Clear all items for this session."""
@@ -357,13 +429,31 @@ class SQLiteSession(SessionABC):
                 )
                 conn.commit()
 
-        await asyncio.to_thread(_clear_session_sync)
+        await asyncio.get_running_loop().run_in_executor(self._write_executor, _clear_session_sync)
 
     def close(self) -> None:
         """Close the database connection."""
+        if self._closed:
+            # Submitting the checkpoint closure to an already shut-down executor raises,
+            # so keep repeated close() calls a no-op.
+            return
+        self._closed = True
         if self._is_memory_db:
+            self._write_executor.shutdown(wait=True)
             if hasattr(self, "_shared_connection"):
                 self._shared_connection.close()
         else:
-            if hasattr(self._local, "connection"):
-                self._local.connection.close()
+
+            def _close_thread_connection() -> None:
+                if hasattr(self._local, "connection"):
+                    conn = self._local.connection
+                    # Fold the WAL back into the database and truncate it, so short-lived
+                    # sessions don't leave -wal files behind to replay on the next open.
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    conn.close()
+
+            # The writer thread holds its own thread-local connection; close it on that
+            # thread before retiring the executor.
+            self._write_executor.submit(_close_thread_connection)
+            self._write_executor.shutdown(wait=True)
+            _close_thread_connection()
@@ -128,7 +128,9 @@ class ChatCmplStreamHandler:
                     )
 
                 if reasoning_content and state.reasoning_content_index_and_output:
-                    yield ResponseReasoningSummaryTextDeltaEvent(
+                    # Delta events are emitted once per chunk; `model_construct` skips pydantic
+                    # validation of fields we just built from an already-validated chunk.
+                    yield ResponseReasoningSummaryTextDeltaEvent.model_construct(
                         delta=reasoning_content,
                         item_id=FAKE_RESPONSES_ID,
                         output_index=0,
@@ -189,13 +191,13 @@ class ChatCmplStreamHandler:
                         type="response.content_part.added",
                         sequence_number=sequence_number.get_and_increment(),
                     )
-                # Emit the delta for this segment of content
-                yield ResponseTextDeltaEvent(
+                # Emit the delta for this segment of content. This is the per-token hot path,
+                # so `model_construct` skips pydantic validation of trusted internal fields.
+                yield ResponseTextDeltaEvent.model_construct(
                     content_index=state.text_content_index_and_output[0],
                     delta=delta.content,
                     item_id=FAKE_RESPONSES_ID,
-                    output_index=state.reasoning_content_index_and_output
-                    is not None,  # fixed 0 -> 0 or 1
+                    output_index=int(state.reasoning_content_index_and_output is not None),
                     type="response.output_text.delta",
                     sequence_number=sequence_number.get_and_increment(),
                 )
@@ -245,13 +247,13 @@ class ChatCmplStreamHandler:
                         type="response.content_part.added",
                         sequence_number=sequence_number.get_and_increment(),
                     )
-                # Emit the delta for this segment of refusal
-                yield ResponseRefusalDeltaEvent(
+                # Emit the delta for this segment of refusal. As with text deltas, this runs
+                # per chunk, so skip pydantic validation of trusted internal fields.
+                yield ResponseRefusalDeltaEvent.model_construct(
                     content_index=state.refusal_content_index_and_output[0],
                     delta=delta.refusal,
                     item_id=FAKE_RESPONSES_ID,
-                    output_index=state.reasoning_content_index_and_output
-                    is not None,  # fixed 0 -> 0 or 1
+                    output_index=int(state.reasoning_content_index_and_output is not None),
                     type="response.refusal.delta",
                     sequence_number=sequence_number.get_and_increment(),
                 )
@@ -332,7 +334,8 @@ class ChatCmplStreamHandler:
                         tc_function.arguments):
 
                         output_index = state.function_call_output_idx[tc_delta.index]
-                        yield ResponseFunctionCallArgumentsDeltaEvent(
+                        # Per-chunk hot path; skip validation of trusted internal fields.
+                        yield ResponseFunctionCallArgumentsDeltaEvent.model_construct(
                             delta=tc_function.arguments,
                             item_id=FAKE_RESPONSES_ID,
                             output_index=output_index,
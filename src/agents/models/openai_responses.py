@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
@@ -37,7 +38,8 @@ from ..tool import (
     Tool,
     WebSearchTool,
 )
-from ..tracing import SpanError, response_span
+from ..tracing import Span, SpanError, response_span
+from ..tracing.span_data import ResponseSpanData
 from ..usage import Usage
 from ..version import __version__
 from .interface import Model, ModelTracing
@@ -78,7 +80,13 @@ class OpenAIResponsesModel(Model):
         previous_response_id: str | None,
         prompt: ResponsePromptParam | None = None,
     ) -> ModelResponse:
-        with response_span(disabled=tracing.is_disabled()) as span_response:
+        # When tracing is disabled, skip the span machinery entirely rather than going
+        # through a no-op span: creating one still allocates span data and touches the
+        # current-span contextvar on every call.
+        span_cm: AbstractContextManager[Span[ResponseSpanData] | None] = (
+            nullcontext() if tracing.is_disabled() else response_span()
+        )
+        with span_cm as span_response:
             try:
                 response = await self._fetch_response(
                     system_instructions,
@@ -119,18 +127,19 @@ class OpenAIResponsesModel(Model):
                     else Usage()
                 )
 
-                if tracing.include_data():
+                if span_response is not None and tracing.include_data():
                     span_response.span_data.response = response
                     span_response.span_data.input = input
             except Exception as e:
-                span_response.set_error(
-                    SpanError(
-                        message="Error getting response",
-                        data={
-                            "error": str(e) if tracing.include_data() else e.__class__.__name__,
-                        },
+                if span_response is not None:
+                    span_response.set_error(
+                        SpanError(
+                            message="Error getting response",
+                            data={
+                                "error": str(e) if tracing.include_data() else e.__class__.__name__,
+                            },
+                        )
                     )
-                )
                 request_id = e.request_id if isinstance(e, APIStatusError) else None
                 logger.error(f"Error getting response: {e}. (request_id: {request_id})")
                 raise
@@ -156,7 +165,10 @@ class OpenAIResponsesModel(Model):
         """
         Yields a partial message as it is generated, as well as the usage information.
         """
-        with response_span(disabled=tracing.is_disabled()) as span_response:
+        span_cm: AbstractContextManager[Span[ResponseSpanData] | None] = (
+            nullcontext() if tracing.is_disabled() else response_span()
+        )
+        with span_cm as span_response:
             try:
                 stream = await self._fetch_response(
                     system_instructions,
@@ -177,19 +189,20 @@ class OpenAIResponsesModel(Model):
                         final_response = chunk.response
                     yield chunk
 
-                if final_response and tracing.include_data():
+                if span_response is not None and final_response and tracing.include_data():
                     span_response.span_data.response = final_response
                     span_response.span_data.input = input
 
             except Exception as e:
-                span_response.set_error(
-                    SpanError(
-                        message="Error streaming response",
-                        data={
-                            "error": str(e) if tracing.include_data() else e.__class__.__name__,
-                        },
+                if span_response is not None:
+                    span_response.set_error(
+                        SpanError(
+                            message="Error streaming response",
+                            data={
+                                "error": str(e) if tracing.include_data() else e.__class__.__name__,
+                            },
+                        )
                     )
-                )
                 logger.error(f"Error streaming response: {e}")
                 raise
 
@@ -487,16 +487,20 @@ class RealtimeSession(RealtimeModelListener):
                     )
                 )
 
-    def _cleanup_guardrail_tasks(self) -> None:
-        for task in self._guardrail_tasks:
-            if not task.done():
-                task.cancel()
+    async def _cleanup_guardrail_tasks(self) -> None:
+        # Cancel everything still running in one pass, then let the cancellations land in
+        # a single gather instead of awaiting each task in turn.
+        pending = [task for task in self._guardrail_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         self._guardrail_tasks.clear()
 
     async def _cleanup(self) -> None:
         """Clean up all resources and mark session as closed."""
         # Cancel and cleanup guardrail tasks
-        self._cleanup_guardrail_tasks()
+        await self._cleanup_guardrail_tasks()
 
         # Remove ourselves as a listener
         self._model.remove_listener(self)
@@ -1138,12 +1138,24 @@ class AgentRunner:
 
     @classmethod
     def _get_output_schema(cls, agent: Agent[Any]) -> AgentOutputSchemaBase | None:
-        if agent.output_type is None or agent.output_type is str:
-            return None
-        elif isinstance(agent.output_type, AgentOutputSchemaBase):
-            return agent.output_type
-
-        return AgentOutputSchema(agent.output_type)
+        output_type = agent.output_type
+        # Building an AgentOutputSchema compiles a pydantic TypeAdapter, and this runs on every
+        # turn, so cache the result on the agent. The cache is keyed by the output type so that
+        # reassigning `agent.output_type` still takes effect.
+        cached = agent._cached_output_schema
+        if cached is not None and cached[0] is output_type:
+            return cached[1]
+
+        schema: AgentOutputSchemaBase | None
+        if output_type is None or output_type is str:
+            schema = None
+        elif isinstance(output_type, AgentOutputSchemaBase):
+            schema = output_type
+        else:
+            schema = AgentOutputSchema(output_type)
+
+        agent._cached_output_schema = (output_type, schema)
+        return schema
 
     @classmethod
     async def _get_handoffs(
@@ -72,6 +72,8 @@ class NoOpTrace(Trace):
     A no-op trace that will not be recorded.
     """
 
+    __slots__ = ("_started", "_prev_context_token")
+
     def __init__(self):
         self._started = False
         self._prev_context_token: contextvars.Token[Trace | None] | None = None
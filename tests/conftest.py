@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from agents.models import _openai_shared
@@ -11,6 +13,20 @@ from agents.tracing.setup import get_trace_provider
 
 from .testing_processor import SPAN_PROCESSOR_TESTING
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, and unavailable on Windows
+    uvloop = None  # type: ignore[assignment]
+
+
+if uvloop is not None:
+    # The suite is dominated by small-coroutine scheduling; uvloop's C event loop cuts the
+    # per-await dispatch cost. pytest-asyncio builds every test loop from this policy.
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+        return policy
+
 
 # This fixture will run once before any tests are executed
 @pytest.fixture(scope="session", autouse=True)
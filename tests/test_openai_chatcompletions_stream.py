@@ -26,6 +26,14 @@ from agents.models.interface import ModelTracing
 from agents.models.openai_chatcompletions import OpenAIChatCompletionsModel
 from agents.models.openai_provider import OpenAIProvider
 
+# Group this file onto a single xdist worker so monkeypatching does not race
+# across processes when running with `pytest -n auto --dist loadgroup`.
+pytestmark = pytest.mark.xdist_group("chat_stream")
+
+# A single default settings object is enough for every test in this file, since
+# `stream_response` never mutates it.
+_EMPTY_SETTINGS = ModelSettings()
+
 
 @pytest.mark.allow_call_model_methods
 @pytest.mark.asyncio
@@ -84,7 +92,7 @@ async def test_stream_response_yields_events_for_text_content(monkeypatch) -> No
     async for event in model.stream_response(
         system_instructions=None,
         input="",
-        model_settings=ModelSettings(),
+        model_settings=_EMPTY_SETTINGS,
         tools=[],
         output_schema=None,
         handoffs=[],
@@ -177,7 +185,7 @@ async def test_stream_response_yields_events_for_refusal_content(monkeypatch) ->
     async for event in model.stream_response(
         system_instructions=None,
         input="",
-        model_settings=ModelSettings(),
+        model_settings=_EMPTY_SETTINGS,
         tools=[],
         output_schema=None,
         handoffs=[],
@@ -267,7 +275,7 @@ async def test_stream_response_yields_events_for_tool_call(monkeypatch) -> None:
     async for event in model.stream_response(
         system_instructions=None,
         input="",
-        model_settings=ModelSettings(),
+        model_settings=_EMPTY_SETTINGS,
         tools=[],
         output_schema=None,
         handoffs=[],
@@ -384,7 +392,7 @@ async def test_stream_response_yields_real_time_function_call_arguments(monkeypa
     async for event in model.stream_response(
         system_instructions=None,
         input="",
-        model_settings=ModelSettings(),
+        model_settings=_EMPTY_SETTINGS,
         tools=[],
         output_schema=None,
         handoffs=[],
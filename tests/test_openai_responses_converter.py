@@ -42,6 +42,10 @@ from agents import (
 )
 from agents.models.openai_responses import Converter
 
+# Group this file onto a single xdist worker so monkeypatching does not race
+# across processes when running with `pytest -n auto --dist loadgroup`.
+pytestmark = pytest.mark.xdist_group("responses_converter")
+
 
 def test_convert_tool_choice_standard_values():
     """
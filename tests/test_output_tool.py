@@ -1,4 +1,3 @@
-import json
 from typing import Any
 
 import pytest
@@ -16,6 +15,27 @@ from agents.agent_output import _WRAPPER_DICT_KEY
 from agents.run import AgentRunner
 from agents.util import _json
 
+from ._json_compat import dumps
+
+# Group this file onto a single xdist worker so monkeypatching does not race
+# across processes when running with `pytest -n auto --dist loadgroup`.
+pytestmark = pytest.mark.xdist_group("output_tool")
+
+
+@pytest.fixture(scope="session")
+def output_schema_for():
+    """Memoize output schemas by output type, since building one compiles a pydantic
+    TypeAdapter and the same handful of types is used across tests."""
+    cache: dict[Any, AgentOutputSchemaBase | None] = {}
+
+    def _get(output_type: Any) -> AgentOutputSchemaBase | None:
+        if output_type not in cache:
+            agent = Agent(name="schema_cache", output_type=output_type)
+            cache[output_type] = AgentRunner._get_output_schema(agent)
+        return cache[output_type]
+
+    return _get
+
 
 def test_plain_text_output():
     agent = Agent(name="test")
@@ -30,15 +50,18 @@ class Foo(BaseModel):
     bar: str
 
 
-def test_structured_output_pydantic():
-    agent = Agent(name="test", output_type=Foo)
-    output_schema = AgentRunner._get_output_schema(agent)
+# Pydantic regenerates the JSON schema on every model_json_schema() call, so build it once.
+_FOO_JSON_SCHEMA = Foo.model_json_schema()
+
+
+def test_structured_output_pydantic(output_schema_for):
+    output_schema = output_schema_for(Foo)
     assert output_schema, "Should have an output tool config with a structured output type"
 
     assert isinstance(output_schema, AgentOutputSchema)
     assert output_schema.output_type == Foo, "Should have the correct output type"
     assert not output_schema._is_wrapped, "Pydantic objects should not be wrapped"
-    for key, value in Foo.model_json_schema().items():
+    for key, value in _FOO_JSON_SCHEMA.items():
         assert output_schema.json_schema()[key] == value
 
     json_str = Foo(bar="baz").model_dump_json()
@@ -50,55 +73,51 @@ class Bar(TypedDict):
     bar: str
 
 
-def test_structured_output_typed_dict():
-    agent = Agent(name="test", output_type=Bar)
-    output_schema = AgentRunner._get_output_schema(agent)
+def test_structured_output_typed_dict(output_schema_for):
+    output_schema = output_schema_for(Bar)
     assert output_schema, "Should have an output tool config with a structured output type"
     assert isinstance(output_schema, AgentOutputSchema)
     assert output_schema.output_type == Bar, "Should have the correct output type"
     assert not output_schema._is_wrapped, "TypedDicts should not be wrapped"
 
-    json_str = json.dumps(Bar(bar="baz"))
+    json_str = dumps(Bar(bar="baz"))
     validated = output_schema.validate_json(json_str)
     assert validated == Bar(bar="baz")
 
 
-def test_structured_output_list():
-    agent = Agent(name="test", output_type=list[str])
-    output_schema = AgentRunner._get_output_schema(agent)
+def test_structured_output_list(output_schema_for):
+    output_schema = output_schema_for(list[str])
     assert output_schema, "Should have an output tool config with a structured output type"
     assert isinstance(output_schema, AgentOutputSchema)
     assert output_schema.output_type == list[str], "Should have the correct output type"
     assert output_schema._is_wrapped, "Lists should be wrapped"
 
     # This is testing implementation details, but it's useful  to make sure this doesn't break
-    json_str = json.dumps({_WRAPPER_DICT_KEY: ["foo", "bar"]})
+    json_str = dumps({_WRAPPER_DICT_KEY: ["foo", "bar"]})
     validated = output_schema.validate_json(json_str)
     assert validated == ["foo", "bar"]
 
 
-def test_bad_json_raises_error(mocker):
-    agent = Agent(name="test", output_type=Foo)
-    output_schema = AgentRunner._get_output_schema(agent)
+def test_bad_json_raises_error(mocker, output_schema_for):
+    output_schema = output_schema_for(Foo)
     assert output_schema, "Should have an output tool config with a structured output type"
 
     with pytest.raises(ModelBehaviorError):
         output_schema.validate_json("not valid json")
 
-    agent = Agent(name="test", output_type=list[str])
-    output_schema = AgentRunner._get_output_schema(agent)
+    output_schema = output_schema_for(list[str])
     assert output_schema, "Should have an output tool config with a structured output type"
 
     mock_validate_json = mocker.patch.object(_json, "validate_json")
     mock_validate_json.return_value = ["foo"]
 
     with pytest.raises(ModelBehaviorError):
-        output_schema.validate_json(json.dumps(["foo"]))
+        output_schema.validate_json(dumps(["foo"]))
 
     mock_validate_json.return_value = {"value": "foo"}
 
     with pytest.raises(ModelBehaviorError):
-        output_schema.validate_json(json.dumps(["foo"]))
+        output_schema.validate_json(dumps(["foo"]))
 
 
 def test_plain_text_obj_doesnt_produce_schema():
@@ -110,20 +129,18 @@ def test_plain_text_obj_doesnt_produce_schema():
 def test_structured_output_is_strict():
     output_wrapper = AgentOutputSchema(output_type=Foo)
     assert output_wrapper.is_strict_json_schema()
-    for key, value in Foo.model_json_schema().items():
-        assert output_wrapper.json_schema()[key] == value
+    schema = output_wrapper.json_schema()
+    for key, value in _FOO_JSON_SCHEMA.items():
+        assert schema[key] == value
 
-    assert (
-        "additionalProperties" in output_wrapper.json_schema()
-        and not output_wrapper.json_schema()["additionalProperties"]
-    )
+    assert "additionalProperties" in schema and not schema["additionalProperties"]
 
 
 def test_setting_strict_false_works():
     output_wrapper = AgentOutputSchema(output_type=Foo, strict_json_schema=False)
     assert not output_wrapper.is_strict_json_schema()
-    assert output_wrapper.json_schema() == Foo.model_json_schema()
-    assert output_wrapper.json_schema() == Foo.model_json_schema()
+    assert output_wrapper.json_schema() == _FOO_JSON_SCHEMA
+    assert output_wrapper.json_schema() == _FOO_JSON_SCHEMA
 
 
 _CUSTOM_OUTPUT_SCHEMA_JSON_SCHEMA = {
@@ -163,6 +180,6 @@ def test_custom_output_schema():
     assert not output_schema.is_strict_json_schema()
     assert not output_schema.is_plain_text()
 
-    json_str = json.dumps({"foo": "bar"})
+    json_str = dumps({"foo": "bar"})
     validated = output_schema.validate_json(json_str)
     assert validated == ["some", "output"]
@@ -1,5 +1,3 @@
-import json
-
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel
@@ -9,18 +7,48 @@ from agents.agent_output import _WRAPPER_DICT_KEY
 from agents.util._pretty_print import pretty_print_result, pretty_print_run_result_streaming
 from tests.fake_model import FakeModel
 
+from ._json_compat import dumps
 from .test_responses import get_final_output_message, get_text_message
 
+# Every test here is async and loop-agnostic; share one loop across the module instead of
+# paying loop construction/teardown per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
-async def test_pretty_result():
-    model = FakeModel()
-    model.set_next_output([get_text_message("Hi there")])
+class Foo(BaseModel):
+    bar: str
 
-    agent = Agent(name="test_agent", model=model)
-    result = await Runner.run(agent, input="Hello")
 
-    assert pretty_print_result(result) == snapshot("""\
+# Agent construction triggers pydantic schema plumbing, so build one model and one agent
+# per output shape for the whole module. The fixture resets the shared model's queued
+# outputs before each test.
+_MODEL = FakeModel()
+_AGENT_PLAIN = Agent(name="test_agent", model=_MODEL)
+_AGENT_FOO = Agent(name="test_agent", model=_MODEL, output_type=Foo)
+_AGENT_LIST_FOO = Agent(name="test_agent", model=_MODEL, output_type=list[Foo])
+
+# Foo.model_dump() is just {"bar": ...}, so the wrapped list payloads can be plain dict
+# literals serialized once at import.
+_LIST_PAYLOAD_1 = dumps({_WRAPPER_DICT_KEY: [{"bar": "Hi there"}, {"bar": "Hi there 2"}]})
+_LIST_PAYLOAD_2 = dumps({_WRAPPER_DICT_KEY: [{"bar": "Test"}, {"bar": "Test 2"}]})
+
+
+@pytest.fixture
+def fake_model() -> FakeModel:
+    _MODEL.turn_outputs.clear()
+    _MODEL.last_turn_args = {}
+    _MODEL.hardcoded_usage = None
+    return _MODEL
+
+
+@pytest.mark.parametrize(
+    "agent,outputs,streaming,expected",
+    [
+        pytest.param(
+            _AGENT_PLAIN,
+            [get_text_message("Hi there")],
+            False,
+            snapshot("""\
 RunResult:
 - Last agent: Agent(name="test_agent", ...)
 - Final output (str):
@@ -30,20 +58,14 @@ RunResult:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResult` for more details)\
-""")
-
-
-@pytest.mark.asyncio
-async def test_pretty_run_result_streaming():
-    model = FakeModel()
-    model.set_next_output([get_text_message("Hi there")])
-
-    agent = Agent(name="test_agent", model=model)
-    result = Runner.run_streamed(agent, input="Hello")
-    async for _ in result.stream_events():
-        pass
-
-    assert pretty_print_run_result_streaming(result) == snapshot("""\
+"""),
+            id="plain",
+        ),
+        pytest.param(
+            _AGENT_PLAIN,
+            [get_text_message("Hi there")],
+            True,
+            snapshot("""\
 RunResultStreaming:
 - Current agent: Agent(name="test_agent", ...)
 - Current turn: 1
@@ -56,27 +78,17 @@ RunResultStreaming:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResultStreaming` for more details)\
-""")
-
-
-class Foo(BaseModel):
-    bar: str
-
-
-@pytest.mark.asyncio
-async def test_pretty_run_result_structured_output():
-    model = FakeModel()
-    model.set_next_output(
-        [
-            get_text_message("Test"),
-            get_final_output_message(Foo(bar="Hi there").model_dump_json()),
-        ]
-    )
-
-    agent = Agent(name="test_agent", model=model, output_type=Foo)
-    result = await Runner.run(agent, input="Hello")
-
-    assert pretty_print_result(result) == snapshot("""\
+"""),
+            id="plain_streaming",
+        ),
+        pytest.param(
+            _AGENT_FOO,
+            [
+                get_text_message("Test"),
+                get_final_output_message(Foo(bar="Hi there").model_dump_json()),
+            ],
+            False,
+            snapshot("""\
 RunResult:
 - Last agent: Agent(name="test_agent", ...)
 - Final output (Foo):
@@ -88,26 +100,17 @@ RunResult:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResult` for more details)\
-""")
-
-
-@pytest.mark.asyncio
-async def test_pretty_run_result_streaming_structured_output():
-    model = FakeModel()
-    model.set_next_output(
-        [
-            get_text_message("Test"),
-            get_final_output_message(Foo(bar="Hi there").model_dump_json()),
-        ]
-    )
-
-    agent = Agent(name="test_agent", model=model, output_type=Foo)
-    result = Runner.run_streamed(agent, input="Hello")
-
-    async for _ in result.stream_events():
-        pass
-
-    assert pretty_print_run_result_streaming(result) == snapshot("""\
+"""),
+            id="structured",
+        ),
+        pytest.param(
+            _AGENT_FOO,
+            [
+                get_text_message("Test"),
+                get_final_output_message(Foo(bar="Hi there").model_dump_json()),
+            ],
+            True,
+            snapshot("""\
 RunResultStreaming:
 - Current agent: Agent(name="test_agent", ...)
 - Current turn: 1
@@ -122,32 +125,17 @@ RunResultStreaming:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResultStreaming` for more details)\
-""")
-
-
-@pytest.mark.asyncio
-async def test_pretty_run_result_list_structured_output():
-    model = FakeModel()
-    model.set_next_output(
-        [
-            get_text_message("Test"),
-            get_final_output_message(
-                json.dumps(
-                    {
-                        _WRAPPER_DICT_KEY: [
-                            Foo(bar="Hi there").model_dump(),
-                            Foo(bar="Hi there 2").model_dump(),
-                        ]
-                    }
-                )
-            ),
-        ]
-    )
-
-    agent = Agent(name="test_agent", model=model, output_type=list[Foo])
-    result = await Runner.run(agent, input="Hello")
-
-    assert pretty_print_result(result) == snapshot("""\
+"""),
+            id="structured_streaming",
+        ),
+        pytest.param(
+            _AGENT_LIST_FOO,
+            [
+                get_text_message("Test"),
+                get_final_output_message(_LIST_PAYLOAD_1),
+            ],
+            False,
+            snapshot("""\
 RunResult:
 - Last agent: Agent(name="test_agent", ...)
 - Final output (list):
@@ -157,35 +145,17 @@ RunResult:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResult` for more details)\
-""")
-
-
-@pytest.mark.asyncio
-async def test_pretty_run_result_streaming_list_structured_output():
-    model = FakeModel()
-    model.set_next_output(
-        [
-            get_text_message("Test"),
-            get_final_output_message(
-                json.dumps(
-                    {
-                        _WRAPPER_DICT_KEY: [
-                            Foo(bar="Test").model_dump(),
-                            Foo(bar="Test 2").model_dump(),
-                        ]
-                    }
-                )
-            ),
-        ]
-    )
-
-    agent = Agent(name="test_agent", model=model, output_type=list[Foo])
-    result = Runner.run_streamed(agent, input="Hello")
-
-    async for _ in result.stream_events():
-        pass
-
-    assert pretty_print_run_result_streaming(result) == snapshot("""\
+"""),
+            id="list_structured",
+        ),
+        pytest.param(
+            _AGENT_LIST_FOO,
+            [
+                get_text_message("Test"),
+                get_final_output_message(_LIST_PAYLOAD_2),
+            ],
+            True,
+            snapshot("""\
 RunResultStreaming:
 - Current agent: Agent(name="test_agent", ...)
 - Current turn: 1
@@ -198,4 +168,19 @@ RunResultStreaming:
 - 0 input guardrail result(s)
 - 0 output guardrail result(s)
 (See `RunResultStreaming` for more details)\
-""")
+"""),
+            id="list_structured_streaming",
+        ),
+    ],
+)
+async def test_pretty_print(fake_model: FakeModel, agent, outputs, streaming, expected):
+    fake_model.set_next_output(outputs)
+
+    if streaming:
+        streamed = Runner.run_streamed(agent, input="Hello")
+        async for _ in streamed.stream_events():
+            pass
+        assert pretty_print_run_result_streaming(streamed) == expected
+    else:
+        result = await Runner.run(agent, input="Hello")
+        assert pretty_print_result(result) == expected
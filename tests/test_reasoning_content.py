@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from typing import Any, cast
+from typing import Any
 
 import pytest
 from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
@@ -23,6 +23,10 @@ from agents.models.interface import ModelTracing
 from agents.models.openai_chatcompletions import OpenAIChatCompletionsModel
 from agents.models.openai_provider import OpenAIProvider
 
+# Every test here is async and loop-agnostic; share one loop across the module instead of
+# paying loop construction/teardown per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 # Helper functions to create test objects consistently
 def create_content_delta(content: str) -> dict[str, Any]:
@@ -41,38 +45,34 @@ def create_reasoning_delta(content: str) -> dict[str, Any]:
     }
 
 
+# Validated once at import; per-call chunks are cloned from this template via model_copy,
+# which skips re-running the pydantic validators for every chunk.
+_TEMPLATE_CHUNK = ChatCompletionChunk(
+    id="chunk-id",
+    created=1,
+    model="deepseek is usually expected",
+    object="chat.completion.chunk",
+    choices=[Choice(index=0, delta=ChoiceDelta())],
+)
+
+
 def create_chunk(delta: dict[str, Any], include_usage: bool = False) -> ChatCompletionChunk:
     """Create a ChatCompletionChunk with the given delta"""
-    # Create a ChoiceDelta object from the dictionary
-    delta_obj = ChoiceDelta(
-        content=delta.get("content"),
-        role=delta.get("role"),
-        function_call=delta.get("function_call"),
-        tool_calls=delta.get("tool_calls"),
-    )
+    # Create a ChoiceDelta from the dictionary; `model_construct` stores the extra
+    # `reasoning_content` key directly without running pydantic's validating setter.
+    delta_obj = ChoiceDelta.model_construct(**delta)
 
-    # Add reasoning_content attribute dynamically if present in the delta
-    if "reasoning_content" in delta:
-        # Use direct assignment for the reasoning_content attribute
-        delta_obj_any = cast(Any, delta_obj)
-        delta_obj_any.reasoning_content = delta["reasoning_content"]
-
-    # Create the chunk
-    chunk = ChatCompletionChunk(
-        id="chunk-id",
-        created=1,
-        model="deepseek is usually expected",
-        object="chat.completion.chunk",
-        choices=[Choice(index=0, delta=delta_obj)],
-    )
+    # Clone the template instead of re-validating a fresh chunk
+    chunk = _TEMPLATE_CHUNK.model_copy(deep=True)
+    chunk.choices[0].delta = delta_obj
 
     if include_usage:
-        chunk.usage = CompletionUsage(
+        chunk.usage = CompletionUsage.model_construct(
             completion_tokens=4,
             prompt_tokens=2,
             total_tokens=6,
-            completion_tokens_details=CompletionTokensDetails(reasoning_tokens=2),
-            prompt_tokens_details=PromptTokensDetails(cached_tokens=0),
+            completion_tokens_details=CompletionTokensDetails.model_construct(reasoning_tokens=2),
+            prompt_tokens_details=PromptTokensDetails.model_construct(cached_tokens=0),
         )
 
     return chunk
@@ -86,7 +86,6 @@ async def create_fake_stream(
 
 
 @pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
 async def test_stream_response_yields_events_for_reasoning_content(monkeypatch) -> None:
     """
     Validate that when a model streams reasoning content,
@@ -119,19 +118,20 @@ async def test_stream_response_yields_events_for_reasoning_content(monkeypatch)
 
     monkeypatch.setattr(OpenAIChatCompletionsModel, "_fetch_response", patched_fetch_response)
     model = OpenAIProvider(use_responses=False).get_model("gpt-4")
-    output_events = []
-    async for event in model.stream_response(
-        system_instructions=None,
-        input="",
-        model_settings=ModelSettings(),
-        tools=[],
-        output_schema=None,
-        handoffs=[],
-        tracing=ModelTracing.DISABLED,
-        previous_response_id=None,
-        prompt=None,
-    ):
-        output_events.append(event)
+    output_events = [
+        event
+        async for event in model.stream_response(
+            system_instructions=None,
+            input="",
+            model_settings=ModelSettings(),
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=ModelTracing.DISABLED,
+            previous_response_id=None,
+            prompt=None,
+        )
+    ]
 
     # verify reasoning content events were emitted
     reasoning_delta_events = [
@@ -163,21 +163,18 @@ async def test_stream_response_yields_events_for_reasoning_content(monkeypatch)
 
 
 @pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
 async def test_get_response_with_reasoning_content(monkeypatch) -> None:
     """
     Test that when a model returns reasoning content in addition to regular content,
     `get_response` properly includes both in the response output.
     """
-    # create a message with reasoning content
-    msg = ChatCompletionMessage(
+    # Create a message with reasoning content; `model_construct` lets us attach the
+    # non-standard `reasoning_content` field without pydantic's validating setter.
+    msg_with_reasoning = ChatCompletionMessage.model_construct(
         role="assistant",
         content="The answer is 42",
+        reasoning_content="Let me think about this question carefully",
     )
-    # Use dynamic attribute for reasoning_content
-    # We need to cast to Any to avoid mypy errors since reasoning_content is not a defined attribute
-    msg_with_reasoning = cast(Any, msg)
-    msg_with_reasoning.reasoning_content = "Let me think about this question carefully"
 
     # create a choice with the message
     mock_choice = {
@@ -233,7 +230,6 @@ async def test_get_response_with_reasoning_content(monkeypatch) -> None:
 
 
 @pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
 async def test_stream_response_with_empty_reasoning_content(monkeypatch) -> None:
     """
     Test that when a model streams empty reasoning content,
@@ -260,19 +256,20 @@ async def test_stream_response_with_empty_reasoning_content(monkeypatch) -> None
 
     monkeypatch.setattr(OpenAIChatCompletionsModel, "_fetch_response", patched_fetch_response)
     model = OpenAIProvider(use_responses=False).get_model("gpt-4")
-    output_events = []
-    async for event in model.stream_response(
-        system_instructions=None,
-        input="",
-        model_settings=ModelSettings(),
-        tools=[],
-        output_schema=None,
-        handoffs=[],
-        tracing=ModelTracing.DISABLED,
-        previous_response_id=None,
-        prompt=None,
-    ):
-        output_events.append(event)
+    output_events = [
+        event
+        async for event in model.stream_response(
+            system_instructions=None,
+            input="",
+            model_settings=ModelSettings(),
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=ModelTracing.DISABLED,
+            previous_response_id=None,
+            prompt=None,
+        )
+    ]
 
     # verify the final response contains the content
     response_event = output_events[-1]
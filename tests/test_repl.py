@@ -5,8 +5,11 @@ from agents import Agent, run_demo_loop
 from .fake_model import FakeModel
 from .test_responses import get_text_input_item, get_text_message
 
+# Every test here is async and loop-agnostic; share one loop across the module instead of
+# paying loop construction/teardown per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
 async def test_run_demo_loop_conversation(monkeypatch, capsys):
     model = FakeModel()
     model.add_multiple_turn_outputs([[get_text_message("hello")], [get_text_message("good")]])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from openai.types.responses import (
@@ -26,19 +27,29 @@ def get_text_input_item(content: str) -> TResponseInputItem:
     }
 
 
+@functools.lru_cache(maxsize=128)
 def get_text_message(content: str) -> ResponseOutputItem:
-    return ResponseOutputMessage(
+    # Cached: these messages are built with the same handful of strings all over the
+    # suite and are never mutated by tests, only compared. `model_construct` skips
+    # pydantic validation of these fully controlled inputs.
+    return ResponseOutputMessage.model_construct(
         id="1",
         type="message",
         role="assistant",
-        content=[ResponseOutputText(text=content, type="output_text", annotations=[])],
+        content=[
+            ResponseOutputText.model_construct(text=content, type="output_text", annotations=[])
+        ],
         status="completed",
     )
 
 
+@functools.lru_cache(maxsize=128)
 def get_function_tool(
     name: str | None = None, return_value: str | None = None, hide_errors: bool = False
 ) -> FunctionTool:
+    # Cached: function_tool() builds a JSON schema per call, and the suite requests the
+    # same few (name, return_value) combinations over and over. The returned tool is
+    # never mutated by tests.
     def _foo() -> str:
         return return_value or "result_ok"
 
@@ -52,7 +63,7 @@ def get_function_tool(
 def get_function_tool_call(
     name: str, arguments: str | None = None, call_id: str | None = None
 ) -> ResponseOutputItem:
-    return ResponseFunctionToolCall(
+    return ResponseFunctionToolCall.model_construct(
         id="1",
         call_id=call_id or "2",
         type="function_call",
@@ -68,11 +79,12 @@ def get_handoff_tool_call(
     return get_function_tool_call(name, args)
 
 
+@functools.lru_cache(maxsize=128)
 def get_final_output_message(args: str) -> ResponseOutputItem:
-    return ResponseOutputMessage(
+    return ResponseOutputMessage.model_construct(
         id="1",
         type="message",
         role="assistant",
-        content=[ResponseOutputText(text=args, type="output_text", annotations=[])],
+        content=[ResponseOutputText.model_construct(text=args, type="output_text", annotations=[])],
         status="completed",
     )
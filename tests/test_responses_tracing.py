@@ -13,12 +13,29 @@ from tests import fake_model
 from .testing_processor import assert_no_spans, fetch_normalized_spans, fetch_ordered_spans
 
 
+@pytest.fixture(scope="module")
+def responses_model() -> OpenAIResponsesModel:
+    # Client construction (httpx/SSL/connection-pool setup) is pure fixed overhead here,
+    # since every test monkeypatches _fetch_response away; share one model per module.
+    return OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
+
+
 class DummyTracing:
+    __slots__ = ()
+
     def is_disabled(self):
         return False
 
 
 class DummyUsage:
+    __slots__ = (
+        "input_tokens",
+        "input_tokens_details",
+        "output_tokens",
+        "output_tokens_details",
+        "total_tokens",
+    )
+
     def __init__(
         self,
         input_tokens: int = 1,
@@ -40,129 +57,69 @@ class DummyUsage:
         )
 
 
+# Response construction runs the full pydantic validator, so build the two fixture
+# responses once at import instead of per iteration.
+_EMPTY_RESPONSE = fake_model.get_response_obj([])
+_ID123_RESPONSE = fake_model.get_response_obj([], "dummy-id-123")
+
+
 class DummyResponse:
+    __slots__ = ("id", "output", "usage")
+
     def __init__(self):
         self.id = "dummy-id"
         self.output = []
         self.usage = DummyUsage()
 
-    def __aiter__(self):
+    async def __aiter__(self):
         yield ResponseCompletedEvent(
             type="response.completed",
-            response=fake_model.get_response_obj(self.output),
+            response=_EMPTY_RESPONSE,
             sequence_number=0,
         )
 
 
-@pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
-async def test_get_response_creates_trace(monkeypatch):
-    with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
-
-        # Mock _fetch_response to return a dummy response with a known id
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            return DummyResponse()
-
-        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
-
-        # Call get_response
-        await model.get_response(
-            "instr",
-            "input",
-            ModelSettings(),
-            [],
-            None,
-            [],
-            ModelTracing.ENABLED,
-            previous_response_id=None,
+class DummyStream:
+    async def __aiter__(self):
+        yield ResponseCompletedEvent(
+            type="response.completed",
+            response=_ID123_RESPONSE,
+            sequence_number=0,
         )
 
-    assert fetch_normalized_spans() == snapshot(
-        [
-            {
-                "workflow_name": "test",
-                "children": [{"type": "response", "data": {"response_id": "dummy-id"}}],
-            }
-        ]
-    )
 
+# DummyStream holds no per-iteration state (each `async for` gets a fresh generator from
+# __aiter__), so one shared instance serves every streaming test.
+_DUMMY_STREAM = DummyStream()
 
-@pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
-async def test_non_data_tracing_doesnt_set_response_id(monkeypatch):
-    with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
 
-        # Mock _fetch_response to return a dummy response with a known id
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            return DummyResponse()
+# Module-level fetch stand-ins: defining these inside each test re-created the function
+# object (and the DummyStream class) on every run.
+async def dummy_fetch_response(*args, **kwargs):
+    return DummyResponse()
 
-        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
 
-        # Call get_response
-        await model.get_response(
-            "instr",
-            "input",
-            ModelSettings(),
-            [],
-            None,
-            [],
-            ModelTracing.ENABLED_WITHOUT_DATA,
-            previous_response_id=None,
-        )
+async def dummy_fetch_stream_response(*args, **kwargs):
+    return _DUMMY_STREAM
 
-    assert fetch_normalized_spans() == snapshot(
-        [{"workflow_name": "test", "children": [{"type": "response"}]}]
-    )
 
-    [span] = fetch_ordered_spans()
-    assert span.span_data.response is None
+# The three non-streaming tests (and their three streaming twins) only differed by the
+# ModelTracing mode, so parametrize over the mode instead of duplicating each test body.
+_TRACING_MODE_CASES = [
+    pytest.param(ModelTracing.ENABLED, id="enabled"),
+    pytest.param(ModelTracing.ENABLED_WITHOUT_DATA, id="enabled_without_data"),
+    pytest.param(ModelTracing.DISABLED, id="disabled"),
+]
 
 
 @pytest.mark.allow_call_model_methods
 @pytest.mark.asyncio
-async def test_disable_tracing_does_not_create_span(monkeypatch):
+@pytest.mark.parametrize("tracing_mode", _TRACING_MODE_CASES)
+async def test_get_response_tracing(monkeypatch, responses_model, tracing_mode):
     with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
+        model = responses_model
 
         # Mock _fetch_response to return a dummy response with a known id
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            return DummyResponse()
-
         monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
 
         # Call get_response
@@ -173,99 +130,41 @@ async def test_disable_tracing_does_not_create_span(monkeypatch):
             [],
             None,
             [],
-            ModelTracing.DISABLED,
+            tracing_mode,
             previous_response_id=None,
         )
 
-    assert fetch_normalized_spans() == snapshot([{"workflow_name": "test"}])
-
-    assert_no_spans()
-
+    if tracing_mode == ModelTracing.ENABLED:
+        assert fetch_normalized_spans() == snapshot(
+            [
+                {
+                    "workflow_name": "test",
+                    "children": [{"type": "response", "data": {"response_id": "dummy-id"}}],
+                }
+            ]
+        )
+    elif tracing_mode == ModelTracing.ENABLED_WITHOUT_DATA:
+        assert fetch_normalized_spans() == snapshot(
+            [{"workflow_name": "test", "children": [{"type": "response"}]}]
+        )
 
-@pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
-async def test_stream_response_creates_trace(monkeypatch):
-    with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
-
-        # Define a dummy fetch function that returns an async stream with a dummy response
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            class DummyStream:
-                async def __aiter__(self):
-                    yield ResponseCompletedEvent(
-                        type="response.completed",
-                        response=fake_model.get_response_obj([], "dummy-id-123"),
-                        sequence_number=0,
-                    )
+        [span] = fetch_ordered_spans()
+        assert span.span_data.response is None
+    else:
+        assert fetch_normalized_spans() == snapshot([{"workflow_name": "test"}])
 
-            return DummyStream()
-
-        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
-
-        # Consume the stream to trigger processing of the final response
-        async for _ in model.stream_response(
-            "instr",
-            "input",
-            ModelSettings(),
-            [],
-            None,
-            [],
-            ModelTracing.ENABLED,
-            previous_response_id=None,
-        ):
-            pass
-
-    assert fetch_normalized_spans() == snapshot(
-        [
-            {
-                "workflow_name": "test",
-                "children": [{"type": "response", "data": {"response_id": "dummy-id-123"}}],
-            }
-        ]
-    )
+        assert_no_spans()
 
 
 @pytest.mark.allow_call_model_methods
 @pytest.mark.asyncio
-async def test_stream_non_data_tracing_doesnt_set_response_id(monkeypatch):
+@pytest.mark.parametrize("tracing_mode", _TRACING_MODE_CASES)
+async def test_stream_response_tracing(monkeypatch, responses_model, tracing_mode):
     with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
-
-        # Define a dummy fetch function that returns an async stream with a dummy response
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            class DummyStream:
-                async def __aiter__(self):
-                    yield ResponseCompletedEvent(
-                        type="response.completed",
-                        response=fake_model.get_response_obj([], "dummy-id-123"),
-                        sequence_number=0,
-                    )
-
-            return DummyStream()
+        model = responses_model
 
-        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
+        # Return an async stream with a dummy response from _fetch_response
+        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_stream_response)
 
         # Consume the stream to trigger processing of the final response
         async for _ in model.stream_response(
@@ -275,64 +174,29 @@ async def test_stream_non_data_tracing_doesnt_set_response_id(monkeypatch):
             [],
             None,
             [],
-            ModelTracing.ENABLED_WITHOUT_DATA,
+            tracing_mode,
             previous_response_id=None,
         ):
             pass
 
-    assert fetch_normalized_spans() == snapshot(
-        [{"workflow_name": "test", "children": [{"type": "response"}]}]
-    )
-
-    [span] = fetch_ordered_spans()
-    assert isinstance(span.span_data, ResponseSpanData)
-    assert span.span_data.response is None
-
-
-@pytest.mark.allow_call_model_methods
-@pytest.mark.asyncio
-async def test_stream_disabled_tracing_doesnt_create_span(monkeypatch):
-    with trace(workflow_name="test"):
-        # Create an instance of the model
-        model = OpenAIResponsesModel(model="test-model", openai_client=AsyncOpenAI(api_key="test"))
-
-        # Define a dummy fetch function that returns an async stream with a dummy response
-        async def dummy_fetch_response(
-            system_instructions,
-            input,
-            model_settings,
-            tools,
-            output_schema,
-            handoffs,
-            prev_response_id,
-            stream,
-            prompt,
-        ):
-            class DummyStream:
-                async def __aiter__(self):
-                    yield ResponseCompletedEvent(
-                        type="response.completed",
-                        response=fake_model.get_response_obj([], "dummy-id-123"),
-                        sequence_number=0,
-                    )
-
-            return DummyStream()
-
-        monkeypatch.setattr(model, "_fetch_response", dummy_fetch_response)
-
-        # Consume the stream to trigger processing of the final response
-        async for _ in model.stream_response(
-            "instr",
-            "input",
-            ModelSettings(),
-            [],
-            None,
-            [],
-            ModelTracing.DISABLED,
-            previous_response_id=None,
-        ):
-            pass
+    if tracing_mode == ModelTracing.ENABLED:
+        assert fetch_normalized_spans() == snapshot(
+            [
+                {
+                    "workflow_name": "test",
+                    "children": [{"type": "response", "data": {"response_id": "dummy-id-123"}}],
+                }
+            ]
+        )
+    elif tracing_mode == ModelTracing.ENABLED_WITHOUT_DATA:
+        assert fetch_normalized_spans() == snapshot(
+            [{"workflow_name": "test", "children": [{"type": "response"}]}]
+        )
 
-    assert fetch_normalized_spans() == snapshot([{"workflow_name": "test"}])
+        [span] = fetch_ordered_spans()
+        assert isinstance(span.span_data, ResponseSpanData)
+        assert span.span_data.response is None
+    else:
+        assert fetch_normalized_spans() == snapshot([{"workflow_name": "test"}])
 
-    assert_no_spans()
+        assert_no_spans()
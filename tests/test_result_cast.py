@@ -23,37 +23,51 @@ class Foo(BaseModel):
     bar: int
 
 
-def test_result_cast_typechecks():
+@pytest.fixture(scope="module")
+def results() -> dict[str, RunResult]:
+    # Each RunResult drags in an Agent and a RunContextWrapper; final_output_as is a pure
+    # read, so three shared instances cover every cast case in the module.
+    return {
+        "int": create_run_result(1),
+        "str": create_run_result("test"),
+        "foo": create_run_result(Foo(bar=1)),
+    }
+
+
+@pytest.mark.parametrize(
+    "key,cast_to,expected",
+    [
+        ("int", int, 1),
+        ("str", str, "test"),
+        ("foo", Foo, Foo(bar=1)),
+    ],
+)
+def test_result_cast_typechecks(results: dict[str, RunResult], key, cast_to, expected):
     """Correct casts should work fine."""
-    result = create_run_result(1)
-    assert result.final_output_as(int) == 1
+    assert results[key].final_output_as(cast_to) == expected
 
-    result = create_run_result("test")
-    assert result.final_output_as(str) == "test"
 
-    result = create_run_result(Foo(bar=1))
-    assert result.final_output_as(Foo) == Foo(bar=1)
-
-
-def test_bad_cast_doesnt_raise():
+@pytest.mark.parametrize(
+    "key,cast_to",
+    [
+        ("int", str),
+        ("str", Foo),
+    ],
+)
+def test_bad_cast_doesnt_raise(results: dict[str, RunResult], key, cast_to):
     """Bad casts shouldn't error unless we ask for it."""
-    result = create_run_result(1)
-    result.final_output_as(str)
-
-    result = create_run_result("test")
-    result.final_output_as(Foo)
-
-
-def test_bad_cast_with_param_raises():
+    results[key].final_output_as(cast_to)
+
+
+@pytest.mark.parametrize(
+    "key,cast_to",
+    [
+        ("int", str),
+        ("str", Foo),
+        ("foo", int),
+    ],
+)
+def test_bad_cast_with_param_raises(results: dict[str, RunResult], key, cast_to):
     """Bad casts should raise a TypeError when we ask for it."""
-    result = create_run_result(1)
-    with pytest.raises(TypeError):
-        result.final_output_as(str, raise_if_incorrect_type=True)
-
-    result = create_run_result("test")
-    with pytest.raises(TypeError):
-        result.final_output_as(Foo, raise_if_incorrect_type=True)
-
-    result = create_run_result(Foo(bar=1))
     with pytest.raises(TypeError):
-        result.final_output_as(int, raise_if_incorrect_type=True)
+        results[key].final_output_as(cast_to, raise_if_incorrect_type=True)
@@ -5,15 +5,25 @@ from unittest import mock
 import pytest
 
 from agents import Agent, Runner
-from agents.run import AgentRunner, set_default_agent_runner
+from agents.run import set_default_agent_runner
 
 from .fake_model import FakeModel
 
 
+class StubRunner:
+    """Hand-rolled AgentRunner stand-in. mock.Mock(spec=AgentRunner) introspects the
+    entire class to build the spec, which dwarfs the actual work of this test."""
+
+    def __init__(self) -> None:
+        self.run = mock.AsyncMock()
+        self.run_streamed = mock.Mock()
+        self.run_sync = mock.Mock()
+
+
 @pytest.mark.asyncio
 async def test_static_run_methods_call_into_default_runner() -> None:
-    runner = mock.Mock(spec=AgentRunner)
-    set_default_agent_runner(runner)
+    runner = StubRunner()
+    set_default_agent_runner(runner)  # type: ignore[arg-type]
 
     agent = Agent(name="test", model=FakeModel())
     await Runner.run(agent, input="test")
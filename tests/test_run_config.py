@@ -2,12 +2,24 @@ from __future__ import annotations
 
 import pytest
 
-from agents import Agent, RunConfig, Runner
+from agents import Agent, RunConfig
 from agents.models.interface import Model, ModelProvider
+from agents.run import AgentRunner
 
 from .fake_model import FakeModel
 from .test_responses import get_text_message
 
+# Call AgentRunner directly rather than going through Runner.run, which indirects through
+# the process-global default-runner singleton; this keeps the tests hermetic from other
+# modules that swap the default runner.
+_runner = AgentRunner()
+
+# Deterministic message fixtures, built once on import.
+_FROM_PROVIDER = get_text_message("from-provider")
+_OVERRIDE_NAME = get_text_message("override-name")
+_OVERRIDE_OBJECT = get_text_message("override-object")
+_FROM_AGENT_OBJECT = get_text_message("from-agent-object")
+
 
 class DummyProvider(ModelProvider):
     """A simple model provider that always returns the same model, and
@@ -30,11 +42,11 @@ async def test_model_provider_on_run_config_is_used_for_agent_model_name() -> No
     provided in the ``RunConfig``, the ``Runner`` should resolve the model using the
     ``model_provider`` on the ``RunConfig``.
     """
-    fake_model = FakeModel(initial_output=[get_text_message("from-provider")])
+    fake_model = FakeModel(initial_output=[_FROM_PROVIDER])
     provider = DummyProvider(model_to_return=fake_model)
     agent = Agent(name="test", model="test-model")
     run_config = RunConfig(model_provider=provider)
-    result = await Runner.run(agent, input="any", run_config=run_config)
+    result = await _runner.run(agent, input="any", run_config=run_config)
     # We picked up the model from our dummy provider
     assert provider.last_requested == "test-model"
     assert result.final_output == "from-provider"
@@ -46,11 +58,11 @@ async def test_run_config_model_name_override_takes_precedence() -> None:
     When a model name string is set on the RunConfig, then that name should be looked up
     using the RunConfig's model_provider, and should override any model on the agent.
     """
-    fake_model = FakeModel(initial_output=[get_text_message("override-name")])
+    fake_model = FakeModel(initial_output=[_OVERRIDE_NAME])
     provider = DummyProvider(model_to_return=fake_model)
     agent = Agent(name="test", model="agent-model")
     run_config = RunConfig(model="override-name", model_provider=provider)
-    result = await Runner.run(agent, input="any", run_config=run_config)
+    result = await _runner.run(agent, input="any", run_config=run_config)
     # We should have requested the override name, not the agent.model
     assert provider.last_requested == "override-name"
     assert result.final_output == "override-name"
@@ -62,10 +74,10 @@ async def test_run_config_model_override_object_takes_precedence() -> None:
     When a concrete Model instance is set on the RunConfig, then that instance should be
     returned by AgentRunner._get_model regardless of the agent's model.
     """
-    fake_model = FakeModel(initial_output=[get_text_message("override-object")])
+    fake_model = FakeModel(initial_output=[_OVERRIDE_OBJECT])
     agent = Agent(name="test", model="agent-model")
     run_config = RunConfig(model=fake_model)
-    result = await Runner.run(agent, input="any", run_config=run_config)
+    result = await _runner.run(agent, input="any", run_config=run_config)
     # Our FakeModel on the RunConfig should have been used.
     assert result.final_output == "override-object"
 
@@ -77,11 +89,11 @@ async def test_agent_model_object_is_used_when_present() -> None:
     not specify a model override, then that object should be used directly without
     consulting the RunConfig's model_provider.
     """
-    fake_model = FakeModel(initial_output=[get_text_message("from-agent-object")])
+    fake_model = FakeModel(initial_output=[_FROM_AGENT_OBJECT])
     provider = DummyProvider()
     agent = Agent(name="test", model=fake_model)
     run_config = RunConfig(model_provider=provider)
-    result = await Runner.run(agent, input="any", run_config=run_config)
+    result = await _runner.run(agent, input="any", run_config=run_config)
     # The dummy provider should never have been called, and the output should come from
     # the FakeModel on the agent.
     assert provider.last_requested is None
@@ -1,46 +1,34 @@
-import json
+from __future__ import annotations
 
 import pytest
 
 from agents import Agent, MaxTurnsExceeded, RunErrorDetails, Runner
+from agents.items import TResponseOutputItem
 
 from .fake_model import FakeModel
 from .test_responses import get_function_tool, get_function_tool_call, get_text_message
 
-
-@pytest.mark.asyncio
-async def test_run_error_includes_data():
-    model = FakeModel()
-    agent = Agent(name="test", model=model, tools=[get_function_tool("foo", "res")])
-    model.add_multiple_turn_outputs(
-        [
-            [get_text_message("1"), get_function_tool_call("foo", json.dumps({"a": "b"}))],
-            [get_text_message("done")],
-        ]
-    )
-    with pytest.raises(MaxTurnsExceeded) as exc:
-        await Runner.run(agent, input="hello", max_turns=1)
-    data = exc.value.run_data
-    assert isinstance(data, RunErrorDetails)
-    assert data.last_agent == agent
-    assert len(data.raw_responses) == 1
-    assert len(data.new_items) > 0
+# These fixtures are deterministic pydantic models; build them once on import.
+_FOO_TOOL = get_function_tool("foo", "res")
+_TURN_OUTPUTS: list[list[TResponseOutputItem] | Exception] = [
+    [get_text_message("1"), get_function_tool_call("foo", '{"a": "b"}')],
+    [get_text_message("done")],
+]
 
 
 @pytest.mark.asyncio
-async def test_streamed_run_error_includes_data():
+@pytest.mark.parametrize("streaming", [False, True], ids=["run", "run_streamed"])
+async def test_run_error_includes_data(streaming: bool):
     model = FakeModel()
-    agent = Agent(name="test", model=model, tools=[get_function_tool("foo", "res")])
-    model.add_multiple_turn_outputs(
-        [
-            [get_text_message("1"), get_function_tool_call("foo", json.dumps({"a": "b"}))],
-            [get_text_message("done")],
-        ]
-    )
-    result = Runner.run_streamed(agent, input="hello", max_turns=1)
+    agent = Agent(name="test", model=model, tools=[_FOO_TOOL])
+    model.add_multiple_turn_outputs(_TURN_OUTPUTS)
     with pytest.raises(MaxTurnsExceeded) as exc:
-        async for _ in result.stream_events():
-            pass
+        if streaming:
+            result = Runner.run_streamed(agent, input="hello", max_turns=1)
+            async for _ in result.stream_events():
+                pass
+        else:
+            await Runner.run(agent, input="hello", max_turns=1)
     data = exc.value.run_data
     assert isinstance(data, RunErrorDetails)
     assert data.last_agent == agent
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import pytest
@@ -17,7 +17,6 @@ from agents import (
     ToolCallItem,
     ToolCallOutputItem,
     TResponseInputItem,
-    Usage,
 )
 from agents._run_impl import (
     NextStepFinalOutput,
@@ -38,78 +37,22 @@ from .test_responses import (
     get_text_input_item,
     get_text_message,
 )
+from .test_run_step_processing import cached_all_tools, cached_handoffs, mk_response
 
+# Shared sentinel context for tests that don't care about the context value; allocating a
+# fresh RunContextWrapper(None) per call is pure overhead.
+_DUMMY_CTX: RunContextWrapper[Any] = RunContextWrapper(context=None)
 
-@pytest.mark.asyncio
-async def test_empty_response_is_final_output():
-    agent = Agent[None](name="test")
-    response = ModelResponse(
-        output=[],
-        usage=Usage(),
-        response_id=None,
-    )
-    result = await get_execute_result(agent, response)
-
-    assert result.original_input == "hello"
-    assert result.generated_items == []
-    assert isinstance(result.next_step, NextStepFinalOutput)
-    assert result.next_step.output == ""
-
-
-@pytest.mark.asyncio
-async def test_plaintext_agent_no_tool_calls_is_final_output():
-    agent = Agent(name="test")
-    response = ModelResponse(
-        output=[get_text_message("hello_world")],
-        usage=Usage(),
-        response_id=None,
-    )
-    result = await get_execute_result(agent, response)
-
-    assert result.original_input == "hello"
-    assert len(result.generated_items) == 1
-    assert_item_is_message(result.generated_items[0], "hello_world")
-    assert isinstance(result.next_step, NextStepFinalOutput)
-    assert result.next_step.output == "hello_world"
-
-
-@pytest.mark.asyncio
-async def test_plaintext_agent_no_tool_calls_multiple_messages_is_final_output():
-    agent = Agent(name="test")
-    response = ModelResponse(
-        output=[
-            get_text_message("hello_world"),
-            get_text_message("bye"),
-        ],
-        usage=Usage(),
-        response_id=None,
-    )
-    result = await get_execute_result(
-        agent,
-        response,
-        original_input=[
-            get_text_input_item("test"),
-            get_text_input_item("test2"),
-        ],
-    )
-
-    assert len(result.original_input) == 2
-    assert len(result.generated_items) == 2
-    assert_item_is_message(result.generated_items[0], "hello_world")
-    assert_item_is_message(result.generated_items[1], "bye")
-
-    assert isinstance(result.next_step, NextStepFinalOutput)
-    assert result.next_step.output == "bye"
+# Default hooks and run config are stateless no-ops here; build them once rather than per
+# get_execute_result call.
+_DEFAULT_HOOKS: RunHooks[Any] = RunHooks()
+_DEFAULT_RUN_CONFIG = RunConfig()
 
 
 @pytest.mark.asyncio
 async def test_plaintext_agent_with_tool_call_is_run_again():
     agent = Agent(name="test", tools=[get_function_tool(name="test", return_value="123")])
-    response = ModelResponse(
-        output=[get_text_message("hello_world"), get_function_tool_call("test", "")],
-        usage=Usage(),
-        response_id=None,
-    )
+    response = mk_response([get_text_message("hello_world"), get_function_tool_call("test", "")])
     result = await get_execute_result(agent, response)
 
     assert result.original_input == "hello"
@@ -136,14 +79,12 @@ async def test_multiple_tool_calls():
             get_function_tool(name="test_3", return_value="789"),
         ],
     )
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
             get_function_tool_call("test_1"),
             get_function_tool_call("test_2"),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
 
     result = await get_execute_result(agent, response)
@@ -161,6 +102,11 @@ async def test_multiple_tool_calls():
     assert isinstance(result.next_step, NextStepRunAgain)
 
 
+# What json.dumps({"value": ...}) would produce, frozen as literals.
+_ARGS_123 = '{"value": "123"}'
+_ARGS_456 = '{"value": "456"}'
+
+
 @pytest.mark.asyncio
 async def test_multiple_tool_calls_with_tool_context():
     async def _fake_tool(context: ToolContext[str], value: str) -> str:
@@ -172,13 +118,11 @@ async def test_multiple_tool_calls_with_tool_context():
         name="test",
         tools=[tool],
     )
-    response = ModelResponse(
-        output=[
-            get_function_tool_call("fake_tool", json.dumps({"value": "123"}), call_id="1"),
-            get_function_tool_call("fake_tool", json.dumps({"value": "456"}), call_id="2"),
-        ],
-        usage=Usage(),
-        response_id=None,
+    response = mk_response(
+        [
+            get_function_tool_call("fake_tool", _ARGS_123, call_id="1"),
+            get_function_tool_call("fake_tool", _ARGS_456, call_id="2"),
+        ]
     )
 
     result = await get_execute_result(agent, response)
@@ -189,8 +133,8 @@ async def test_multiple_tool_calls_with_tool_context():
     assert isinstance(result.next_step, NextStepRunAgain)
 
     items = result.generated_items
-    assert_item_is_function_tool_call(items[0], "fake_tool", json.dumps({"value": "123"}))
-    assert_item_is_function_tool_call(items[1], "fake_tool", json.dumps({"value": "456"}))
+    assert_item_is_function_tool_call(items[0], "fake_tool", _ARGS_123)
+    assert_item_is_function_tool_call(items[1], "fake_tool", _ARGS_456)
     assert_item_is_function_tool_call_output(items[2], "123-1")
     assert_item_is_function_tool_call_output(items[3], "456-2")
 
@@ -202,11 +146,7 @@ async def test_handoff_output_leads_to_handoff_next_step():
     agent_1 = Agent(name="test_1")
     agent_2 = Agent(name="test_2")
     agent_3 = Agent(name="test_3", handoffs=[agent_1, agent_2])
-    response = ModelResponse(
-        output=[get_text_message("Hello, world!"), get_handoff_tool_call(agent_1)],
-        usage=Usage(),
-        response_id=None,
-    )
+    response = mk_response([get_text_message("Hello, world!"), get_handoff_tool_call(agent_1)])
     result = await get_execute_result(agent_3, response)
 
     assert isinstance(result.next_step, NextStepHandoff)
@@ -219,35 +159,82 @@ class Foo(BaseModel):
     bar: str
 
 
+# Serialized once: the payloads are constants, so there's no need to re-run the pydantic
+# serializer in every test.
+_FOO_123_JSON = Foo(bar="123").model_dump_json()
+_FOO_456_JSON = Foo(bar="456").model_dump_json()
+
+# Shared agents for the final-output scenarios below; get_execute_result never mutates
+# them, so building them per parameter case would be wasted work.
+_PLAIN_AGENT: Agent[Any] = Agent(name="test")
+_FOO_AGENT = Agent(name="test", output_type=Foo)
+_HANDOFF_FOO_AGENT = Agent(
+    name="test_3", handoffs=[Agent(name="test_1"), Agent(name="test_2")], output_type=Foo
+)
+
+
 @pytest.mark.asyncio
-async def test_final_output_without_tool_runs_again():
-    agent = Agent(name="test", output_type=Foo, tools=[get_function_tool("tool_1", "result")])
-    response = ModelResponse(
-        output=[get_function_tool_call("tool_1")],
-        usage=Usage(),
-        response_id=None,
-    )
-    result = await get_execute_result(agent, response)
+@pytest.mark.parametrize(
+    "agent,outputs,original_input,expected_output,expected_message_texts",
+    [
+        pytest.param(_PLAIN_AGENT, [], None, "", [], id="empty_response"),
+        pytest.param(
+            _PLAIN_AGENT,
+            [get_text_message("hello_world")],
+            None,
+            "hello_world",
+            ["hello_world"],
+            id="plaintext_no_tool_calls",
+        ),
+        pytest.param(
+            _PLAIN_AGENT,
+            [get_text_message("hello_world"), get_text_message("bye")],
+            [get_text_input_item("test"), get_text_input_item("test2")],
+            "bye",
+            ["hello_world", "bye"],
+            id="multiple_messages",
+        ),
+        pytest.param(
+            _FOO_AGENT,
+            [get_text_message("Hello, world!"), get_final_output_message(_FOO_123_JSON)],
+            None,
+            Foo(bar="123"),
+            None,
+            id="structured_output",
+        ),
+        pytest.param(
+            _HANDOFF_FOO_AGENT,
+            [get_final_output_message(_FOO_123_JSON), get_final_output_message(_FOO_456_JSON)],
+            None,
+            Foo(bar="456"),
+            None,
+            id="multiple_final_outputs",
+        ),
+    ],
+)
+async def test_final_output_variants(
+    agent, outputs, original_input, expected_output, expected_message_texts
+):
+    response = mk_response(outputs)
+    result = await get_execute_result(agent, response, original_input=original_input)
 
-    assert isinstance(result.next_step, NextStepRunAgain)
-    assert len(result.generated_items) == 2, "expected 2 items: tool call, tool call output"
+    assert result.original_input == (original_input if original_input is not None else "hello")
+    assert isinstance(result.next_step, NextStepFinalOutput)
+    assert result.next_step.output == expected_output
+    if expected_message_texts is not None:
+        assert len(result.generated_items) == len(expected_message_texts)
+        for item, text in zip(result.generated_items, expected_message_texts):
+            assert_item_is_message(item, text)
 
 
 @pytest.mark.asyncio
-async def test_final_output_leads_to_final_output_next_step():
-    agent = Agent(name="test", output_type=Foo)
-    response = ModelResponse(
-        output=[
-            get_text_message("Hello, world!"),
-            get_final_output_message(Foo(bar="123").model_dump_json()),
-        ],
-        usage=Usage(),
-        response_id=None,
-    )
+async def test_final_output_without_tool_runs_again():
+    agent = Agent(name="test", output_type=Foo, tools=[get_function_tool("tool_1", "result")])
+    response = mk_response([get_function_tool_call("tool_1")])
     result = await get_execute_result(agent, response)
 
-    assert isinstance(result.next_step, NextStepFinalOutput)
-    assert result.next_step.output == Foo(bar="123")
+    assert isinstance(result.next_step, NextStepRunAgain)
+    assert len(result.generated_items) == 2, "expected 2 items: tool call, tool call output"
 
 
 @pytest.mark.asyncio
@@ -255,13 +242,11 @@ async def test_handoff_and_final_output_leads_to_handoff_next_step():
     agent_1 = Agent(name="test_1")
     agent_2 = Agent(name="test_2")
     agent_3 = Agent(name="test_3", handoffs=[agent_1, agent_2], output_type=Foo)
-    response = ModelResponse(
-        output=[
-            get_final_output_message(Foo(bar="123").model_dump_json()),
+    response = mk_response(
+        [
+            get_final_output_message(_FOO_123_JSON),
             get_handoff_tool_call(agent_1),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
     result = await get_execute_result(agent_3, response)
 
@@ -269,49 +254,37 @@ async def test_handoff_and_final_output_leads_to_handoff_next_step():
     assert result.next_step.new_agent == agent_1
 
 
-@pytest.mark.asyncio
-async def test_multiple_final_output_leads_to_final_output_next_step():
-    agent_1 = Agent(name="test_1")
-    agent_2 = Agent(name="test_2")
-    agent_3 = Agent(name="test_3", handoffs=[agent_1, agent_2], output_type=Foo)
-    response = ModelResponse(
-        output=[
-            get_final_output_message(Foo(bar="123").model_dump_json()),
-            get_final_output_message(Foo(bar="456").model_dump_json()),
-        ],
-        usage=Usage(),
-        response_id=None,
-    )
-    result = await get_execute_result(agent_3, response)
-
-    assert isinstance(result.next_step, NextStepFinalOutput)
-    assert result.next_step.output == Foo(bar="456")
-
-
 # === Helpers ===
 
 
 def assert_item_is_message(item: RunItem, text: str) -> None:
-    assert isinstance(item, MessageOutputItem)
-    assert item.raw_item.type == "message"
-    assert item.raw_item.role == "assistant"
-    assert item.raw_item.content[0].type == "output_text"
-    assert item.raw_item.content[0].text == text
+    # Bind the pydantic attribute chains once; repeated item.raw_item.content[0] lookups
+    # re-run model __getattr__ on every access. These helpers always see exact run-item
+    # types, so type() identity beats the generic __instancecheck__ protocol.
+    assert type(item) is MessageOutputItem
+    raw = item.raw_item
+    content = raw.content[0]
+    assert raw.type == "message"
+    assert raw.role == "assistant"
+    assert content.type == "output_text"
+    assert content.text == text
 
 
 def assert_item_is_function_tool_call(
     item: RunItem, name: str, arguments: str | None = None
 ) -> None:
-    assert isinstance(item, ToolCallItem)
-    assert item.raw_item.type == "function_call"
-    assert item.raw_item.name == name
-    assert not arguments or item.raw_item.arguments == arguments
+    assert type(item) is ToolCallItem
+    raw = item.raw_item
+    assert raw.type == "function_call"
+    assert raw.name == name
+    assert not arguments or raw.arguments == arguments
 
 
 def assert_item_is_function_tool_call_output(item: RunItem, output: str) -> None:
-    assert isinstance(item, ToolCallOutputItem)
-    assert item.raw_item["type"] == "function_call_output"
-    assert item.raw_item["output"] == output
+    assert type(item) is ToolCallOutputItem
+    raw = item.raw_item
+    assert raw["type"] == "function_call_output"
+    assert raw["output"] == output
 
 
 async def get_execute_result(
@@ -324,12 +297,14 @@ async def get_execute_result(
     context_wrapper: RunContextWrapper[Any] | None = None,
     run_config: RunConfig | None = None,
 ) -> SingleStepResult:
+    context_wrapper = context_wrapper or _DUMMY_CTX
     output_schema = AgentRunner._get_output_schema(agent)
-    handoffs = await AgentRunner._get_handoffs(agent, context_wrapper or RunContextWrapper(None))
+    # Handoff and tool resolution are independent, so resolve them concurrently.
+    handoffs, all_tools = await asyncio.gather(cached_handoffs(agent), cached_all_tools(agent))
 
     processed_response = RunImpl.process_model_response(
         agent=agent,
-        all_tools=await agent.get_all_tools(context_wrapper or RunContextWrapper(None)),
+        all_tools=all_tools,
         response=response,
         output_schema=output_schema,
         handoffs=handoffs,
@@ -341,7 +316,7 @@ async def get_execute_result(
         pre_step_items=generated_items or [],
         processed_response=processed_response,
         output_schema=output_schema,
-        hooks=hooks or RunHooks(),
-        context_wrapper=context_wrapper or RunContextWrapper(None),
-        run_config=run_config or RunConfig(),
+        hooks=hooks or _DEFAULT_HOOKS,
+        context_wrapper=context_wrapper,
+        run_config=run_config or _DEFAULT_RUN_CONFIG,
     )
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 import pytest
 from openai.types.responses import (
     ResponseComputerToolCall,
@@ -24,7 +27,9 @@ from agents import (
     Usage,
 )
 from agents._run_impl import RunImpl
+from agents.items import RunItem, TResponseOutputItem
 from agents.run import AgentRunner
+from agents.tool import Tool
 
 from .test_responses import (
     get_final_output_message,
@@ -34,18 +39,79 @@ from .test_responses import (
     get_text_message,
 )
 
+# Every call site here wants the same semantic value — a context wrapper around None — so
+# allocate the sentinel once instead of per call.
+_DUMMY_CTX: RunContextWrapper[None] = RunContextWrapper(context=None)
+
 
 def _dummy_ctx() -> RunContextWrapper[None]:
-    return RunContextWrapper(context=None)
+    return _DUMMY_CTX
+
+
+# The expected default tool name/description for a handoff target are constant per
+# agent; compute them once per agent (Agent is unhashable, so functools.lru_cache is out —
+# reuse the id-keyed pattern from the caches below).
+_handoff_expectations: dict[int, tuple[Agent[Any], str, str]] = {}
+
+
+def _expected_handoff(agent: Agent[Any]) -> tuple[str, str]:
+    cached = _handoff_expectations.get(id(agent))
+    if cached is None or cached[0] is not agent:
+        cached = (agent, Handoff.default_tool_name(agent), Handoff.default_tool_description(agent))
+        _handoff_expectations[id(agent)] = cached
+    return cached[1], cached[2]
+
+
+# Resolving handoffs builds a pydantic Handoff wrapper per target agent, and get_all_tools
+# goes through the async MCP/tool-filter machinery — both deterministic per agent here, so
+# memoize them. Keyed by id() with the agent retained in the value, which keeps the key
+# valid for the cache's lifetime.
+_handoffs_cache: dict[int, tuple[Agent[Any], list[Handoff[Any, Any]]]] = {}
+_all_tools_cache: dict[int, tuple[Agent[Any], list[Tool]]] = {}
+
+
+async def cached_handoffs(agent: Agent[Any]) -> list[Handoff[Any, Any]]:
+    cached = _handoffs_cache.get(id(agent))
+    if cached is None or cached[0] is not agent:
+        cached = (agent, await AgentRunner._get_handoffs(agent, _dummy_ctx()))
+        _handoffs_cache[id(agent)] = cached
+    return cached[1]
+
+
+# Plenty of tests just need an agent with no tools or handoffs to hand to
+# process_model_response, which never mutates it; share one.
+_BARE_AGENT: Agent[Any] = Agent(name="test")
+
+# Usage() is a pydantic model built on every ModelResponse; nothing in these tests reads
+# it, so share one empty instance and fold the boilerplate into a small factory.
+_EMPTY_USAGE = Usage()
+
+
+def mk_response(output: list[TResponseOutputItem]) -> ModelResponse:
+    return ModelResponse(output=output, usage=_EMPTY_USAGE, response_id=None)
+
+
+async def cached_all_tools(agent: Agent[Any]) -> list[Tool]:
+    cached = _all_tools_cache.get(id(agent))
+    if cached is None or cached[0] is not agent:
+        cached = (agent, await agent.get_all_tools(_dummy_ctx()))
+        _all_tools_cache[id(agent)] = cached
+    return cached[1]
+
+
+def _wraps_raw_item(items: list[RunItem], item_type: type[RunItem], raw: Any) -> bool:
+    """Whether some item of `item_type` in `items` wraps exactly `raw`.
+
+    An identity-keyed dict comprehension runs its lookups at C speed, unlike the
+    per-element `any(isinstance(...) and ... is ...)` generator scans it replaces.
+    """
+    raw_map = {id(item.raw_item): item for item in items if type(item) is item_type}
+    return raw_map.get(id(raw)) is not None
 
 
 def test_empty_response():
-    agent = Agent(name="test")
-    response = ModelResponse(
-        output=[],
-        usage=Usage(),
-        response_id=None,
-    )
+    agent = _BARE_AGENT
+    response = mk_response([])
 
     result = RunImpl.process_model_response(
         agent=agent,
@@ -59,12 +125,8 @@ def test_empty_response():
 
 
 def test_no_tool_calls():
-    agent = Agent(name="test")
-    response = ModelResponse(
-        output=[get_text_message("Hello, world!")],
-        usage=Usage(),
-        response_id=None,
-    )
+    agent = _BARE_AGENT
+    response = mk_response([get_text_message("Hello, world!")])
     result = RunImpl.process_model_response(
         agent=agent, response=response, output_schema=None, handoffs=[], all_tools=[]
     )
@@ -75,20 +137,18 @@ def test_no_tool_calls():
 @pytest.mark.asyncio
 async def test_single_tool_call():
     agent = Agent(name="test", tools=[get_function_tool(name="test")])
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
             get_function_tool_call("test", ""),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
     result = RunImpl.process_model_response(
         agent=agent,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
+        all_tools=await cached_all_tools(agent),
     )
     assert not result.handoffs
     assert result.functions and len(result.functions) == 1
@@ -98,28 +158,6 @@ async def test_single_tool_call():
     assert func.tool_call.arguments == ""
 
 
-@pytest.mark.asyncio
-async def test_missing_tool_call_raises_error():
-    agent = Agent(name="test", tools=[get_function_tool(name="test")])
-    response = ModelResponse(
-        output=[
-            get_text_message("Hello, world!"),
-            get_function_tool_call("missing", ""),
-        ],
-        usage=Usage(),
-        response_id=None,
-    )
-
-    with pytest.raises(ModelBehaviorError):
-        RunImpl.process_model_response(
-            agent=agent,
-            response=response,
-            output_schema=None,
-            handoffs=[],
-            all_tools=await agent.get_all_tools(_dummy_ctx()),
-        )
-
-
 @pytest.mark.asyncio
 async def test_multiple_tool_calls():
     agent = Agent(
@@ -130,14 +168,12 @@ async def test_multiple_tool_calls():
             get_function_tool(name="test_3"),
         ],
     )
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
             get_function_tool_call("test_1", "abc"),
             get_function_tool_call("test_2", "xyz"),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
 
     result = RunImpl.process_model_response(
@@ -145,7 +181,7 @@ async def test_multiple_tool_calls():
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
+        all_tools=await cached_all_tools(agent),
     )
     assert not result.handoffs
     assert result.functions and len(result.functions) == 2
@@ -164,84 +200,55 @@ async def test_handoffs_parsed_correctly():
     agent_1 = Agent(name="test_1")
     agent_2 = Agent(name="test_2")
     agent_3 = Agent(name="test_3", handoffs=[agent_1, agent_2])
-    response = ModelResponse(
-        output=[get_text_message("Hello, world!")],
-        usage=Usage(),
-        response_id=None,
-    )
+    response = mk_response([get_text_message("Hello, world!")])
     result = RunImpl.process_model_response(
         agent=agent_3,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent_3.get_all_tools(_dummy_ctx()),
+        all_tools=await cached_all_tools(agent_3),
     )
     assert not result.handoffs, "Shouldn't have a handoff here"
 
-    response = ModelResponse(
-        output=[get_text_message("Hello, world!"), get_handoff_tool_call(agent_1)],
-        usage=Usage(),
-        response_id=None,
-    )
+    response = mk_response([get_text_message("Hello, world!"), get_handoff_tool_call(agent_1)])
+    handoffs, all_tools = await asyncio.gather(cached_handoffs(agent_3), cached_all_tools(agent_3))
     result = RunImpl.process_model_response(
         agent=agent_3,
         response=response,
         output_schema=None,
-        handoffs=await AgentRunner._get_handoffs(agent_3, _dummy_ctx()),
-        all_tools=await agent_3.get_all_tools(_dummy_ctx()),
+        handoffs=handoffs,
+        all_tools=all_tools,
     )
     assert len(result.handoffs) == 1, "Should have a handoff here"
     handoff = result.handoffs[0]
-    assert handoff.handoff.tool_name == Handoff.default_tool_name(agent_1)
-    assert handoff.handoff.tool_description == Handoff.default_tool_description(agent_1)
+    expected_name, expected_desc = _expected_handoff(agent_1)
+    assert handoff.handoff.tool_name == expected_name
+    assert handoff.handoff.tool_description == expected_desc
     assert handoff.handoff.agent_name == agent_1.name
 
-    handoff_agent = await handoff.handoff.on_invoke_handoff(
-        RunContextWrapper(None), handoff.tool_call.arguments
-    )
+    handoff_agent = await handoff.handoff.on_invoke_handoff(_DUMMY_CTX, handoff.tool_call.arguments)
     assert handoff_agent == agent_1
 
 
-@pytest.mark.asyncio
-async def test_missing_handoff_fails():
-    agent_1 = Agent(name="test_1")
-    agent_2 = Agent(name="test_2")
-    agent_3 = Agent(name="test_3", handoffs=[agent_1])
-    response = ModelResponse(
-        output=[get_text_message("Hello, world!"), get_handoff_tool_call(agent_2)],
-        usage=Usage(),
-        response_id=None,
-    )
-    with pytest.raises(ModelBehaviorError):
-        RunImpl.process_model_response(
-            agent=agent_3,
-            response=response,
-            output_schema=None,
-            handoffs=await AgentRunner._get_handoffs(agent_3, _dummy_ctx()),
-            all_tools=await agent_3.get_all_tools(_dummy_ctx()),
-        )
-
-
 @pytest.mark.asyncio
 async def test_multiple_handoffs_doesnt_error():
     agent_1 = Agent(name="test_1")
     agent_2 = Agent(name="test_2")
     agent_3 = Agent(name="test_3", handoffs=[agent_1, agent_2])
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
             get_handoff_tool_call(agent_1),
             get_handoff_tool_call(agent_2),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
+    handoffs, all_tools = await asyncio.gather(cached_handoffs(agent_3), cached_all_tools(agent_3))
     result = RunImpl.process_model_response(
         agent=agent_3,
         response=response,
         output_schema=None,
-        handoffs=await AgentRunner._get_handoffs(agent_3, _dummy_ctx()),
-        all_tools=await agent_3.get_all_tools(_dummy_ctx()),
+        handoffs=handoffs,
+        all_tools=all_tools,
     )
     assert len(result.handoffs) == 2, "Should have multiple handoffs here"
 
@@ -250,16 +257,44 @@ class Foo(BaseModel):
     bar: str
 
 
+# Hosted-tool and reasoning output items are discriminated-union pydantic models; each is
+# a constant here, so validate them once at import and share across tests.
+_FILE_SEARCH_CALL = ResponseFileSearchToolCall(
+    id="fs1",
+    queries=["query"],
+    status="completed",
+    type="file_search_call",
+)
+_WEB_SEARCH_CALL = ResponseFunctionWebSearch(
+    id="w1",
+    action=ActionSearch(type="search", query="query"),
+    status="completed",
+    type="web_search_call",
+)
+_REASONING_ITEM = ResponseReasoningItem(
+    id="r1", type="reasoning", summary=[Summary(text="why", type="summary_text")]
+)
+_COMPUTER_CALL = ResponseComputerToolCall(
+    id="c1",
+    type="computer_call",
+    action=ActionClick(type="click", x=1, y=2, button="left"),
+    call_id="c1",
+    pending_safety_checks=[],
+    status="completed",
+)
+
+
+_FOO_123_JSON = Foo(bar="123").model_dump_json()
+
+
 @pytest.mark.asyncio
 async def test_final_output_parsed_correctly():
     agent = Agent(name="test", output_type=Foo)
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
-            get_final_output_message(Foo(bar="123").model_dump_json()),
-        ],
-        usage=Usage(),
-        response_id=None,
+            get_final_output_message(_FOO_123_JSON),
+        ]
     )
 
     RunImpl.process_model_response(
@@ -267,7 +302,7 @@ async def test_final_output_parsed_correctly():
         response=response,
         output_schema=AgentRunner._get_output_schema(agent),
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
+        all_tools=await cached_all_tools(agent),
     )
 
 
@@ -276,59 +311,35 @@ async def test_file_search_tool_call_parsed_correctly():
     # Ensure that a ResponseFileSearchToolCall output is parsed into a ToolCallItem and that no tool
     # runs are scheduled.
 
-    agent = Agent(name="test")
-    file_search_call = ResponseFileSearchToolCall(
-        id="fs1",
-        queries=["query"],
-        status="completed",
-        type="file_search_call",
-    )
-    response = ModelResponse(
-        output=[get_text_message("hello"), file_search_call],
-        usage=Usage(),
-        response_id=None,
-    )
+    agent = _BARE_AGENT
+    file_search_call = _FILE_SEARCH_CALL
+    response = mk_response([get_text_message("hello"), file_search_call])
     result = RunImpl.process_model_response(
         agent=agent,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
+        all_tools=await cached_all_tools(agent),
     )
     # The final item should be a ToolCallItem for the file search call
-    assert any(
-        isinstance(item, ToolCallItem) and item.raw_item is file_search_call
-        for item in result.new_items
-    )
+    assert _wraps_raw_item(result.new_items, ToolCallItem, file_search_call)
     assert not result.functions
     assert not result.handoffs
 
 
 @pytest.mark.asyncio
 async def test_function_web_search_tool_call_parsed_correctly():
-    agent = Agent(name="test")
-    web_search_call = ResponseFunctionWebSearch(
-        id="w1",
-        action=ActionSearch(type="search", query="query"),
-        status="completed",
-        type="web_search_call",
-    )
-    response = ModelResponse(
-        output=[get_text_message("hello"), web_search_call],
-        usage=Usage(),
-        response_id=None,
-    )
+    agent = _BARE_AGENT
+    web_search_call = _WEB_SEARCH_CALL
+    response = mk_response([get_text_message("hello"), web_search_call])
     result = RunImpl.process_model_response(
         agent=agent,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
-    )
-    assert any(
-        isinstance(item, ToolCallItem) and item.raw_item is web_search_call
-        for item in result.new_items
+        all_tools=await cached_all_tools(agent),
     )
+    assert _wraps_raw_item(result.new_items, ToolCallItem, web_search_call)
     assert not result.functions
     assert not result.handoffs
 
@@ -337,24 +348,16 @@ async def test_function_web_search_tool_call_parsed_correctly():
 async def test_reasoning_item_parsed_correctly():
     # Verify that a Reasoning output item is converted into a ReasoningItem.
 
-    reasoning = ResponseReasoningItem(
-        id="r1", type="reasoning", summary=[Summary(text="why", type="summary_text")]
-    )
-    response = ModelResponse(
-        output=[reasoning],
-        usage=Usage(),
-        response_id=None,
-    )
+    reasoning = _REASONING_ITEM
+    response = mk_response([reasoning])
     result = RunImpl.process_model_response(
-        agent=Agent(name="test"),
+        agent=_BARE_AGENT,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await Agent(name="test").get_all_tools(_dummy_ctx()),
-    )
-    assert any(
-        isinstance(item, ReasoningItem) and item.raw_item is reasoning for item in result.new_items
+        all_tools=await cached_all_tools(_BARE_AGENT),
     )
+    assert _wraps_raw_item(result.new_items, ReasoningItem, reasoning)
 
 
 class DummyComputer(Computer):
@@ -396,30 +399,46 @@ class DummyComputer(Computer):
         return None  # pragma: no cover
 
 
+# DummyComputer is stateless, so one instance (and one ComputerTool wrapping it) serves
+# every test in the module.
+_DUMMY_COMPUTER = DummyComputer()
+_COMPUTER_TOOL = ComputerTool(computer=_DUMMY_COMPUTER)
+
+
+# The three negative-path scenarios share a scaffold: a prebuilt "bad" response that
+# process_model_response must reject. Build the fixtures once and parametrize.
+_MISSING_TOOL_AGENT = Agent(name="test", tools=[get_function_tool(name="test")])
+_BAD_TOOL_RESPONSE = mk_response(
+    [get_text_message("Hello, world!"), get_function_tool_call("missing", "")]
+)
+
+_LIMITED_HANDOFF_AGENT = Agent(name="test_3", handoffs=[Agent(name="test_1")])
+_BAD_HANDOFF_RESPONSE = mk_response(
+    [get_text_message("Hello, world!"), get_handoff_tool_call(Agent(name="test_2"))]
+)
+
+_BAD_COMPUTER_RESPONSE = mk_response([_COMPUTER_CALL])
+
+
 @pytest.mark.asyncio
-async def test_computer_tool_call_without_computer_tool_raises_error():
-    # If the agent has no ComputerTool in its tools, process_model_response should raise a
-    # ModelBehaviorError when encountering a ResponseComputerToolCall.
-    computer_call = ResponseComputerToolCall(
-        id="c1",
-        type="computer_call",
-        action=ActionClick(type="click", x=1, y=2, button="left"),
-        call_id="c1",
-        pending_safety_checks=[],
-        status="completed",
-    )
-    response = ModelResponse(
-        output=[computer_call],
-        usage=Usage(),
-        response_id=None,
-    )
+@pytest.mark.parametrize(
+    "agent,response",
+    [
+        pytest.param(_MISSING_TOOL_AGENT, _BAD_TOOL_RESPONSE, id="missing_tool"),
+        pytest.param(_LIMITED_HANDOFF_AGENT, _BAD_HANDOFF_RESPONSE, id="missing_handoff"),
+        # An agent with no ComputerTool must reject a ResponseComputerToolCall.
+        pytest.param(_BARE_AGENT, _BAD_COMPUTER_RESPONSE, id="computer_call_without_tool"),
+    ],
+)
+async def test_model_behavior_errors(agent, response):
+    handoffs, all_tools = await asyncio.gather(cached_handoffs(agent), cached_all_tools(agent))
     with pytest.raises(ModelBehaviorError):
         RunImpl.process_model_response(
-            agent=Agent(name="test"),
+            agent=agent,
             response=response,
             output_schema=None,
-            handoffs=[],
-            all_tools=await Agent(name="test").get_all_tools(_dummy_ctx()),
+            handoffs=handoffs,
+            all_tools=all_tools,
         )
 
 
@@ -427,32 +446,17 @@ async def test_computer_tool_call_without_computer_tool_raises_error():
 async def test_computer_tool_call_with_computer_tool_parsed_correctly():
     # If the agent contains a ComputerTool, ensure that a ResponseComputerToolCall is parsed into a
     # ToolCallItem and scheduled to run in computer_actions.
-    dummy_computer = DummyComputer()
-    agent = Agent(name="test", tools=[ComputerTool(computer=dummy_computer)])
-    computer_call = ResponseComputerToolCall(
-        id="c1",
-        type="computer_call",
-        action=ActionClick(type="click", x=1, y=2, button="left"),
-        call_id="c1",
-        pending_safety_checks=[],
-        status="completed",
-    )
-    response = ModelResponse(
-        output=[computer_call],
-        usage=Usage(),
-        response_id=None,
-    )
+    agent = Agent(name="test", tools=[_COMPUTER_TOOL])
+    computer_call = _COMPUTER_CALL
+    response = mk_response([computer_call])
     result = RunImpl.process_model_response(
         agent=agent,
         response=response,
         output_schema=None,
         handoffs=[],
-        all_tools=await agent.get_all_tools(_dummy_ctx()),
-    )
-    assert any(
-        isinstance(item, ToolCallItem) and item.raw_item is computer_call
-        for item in result.new_items
+        all_tools=await cached_all_tools(agent),
     )
+    assert _wraps_raw_item(result.new_items, ToolCallItem, computer_call)
     assert result.computer_actions and result.computer_actions[0].tool_call == computer_call
 
 
@@ -463,26 +467,26 @@ async def test_tool_and_handoff_parsed_correctly():
     agent_3 = Agent(
         name="test_3", tools=[get_function_tool(name="test")], handoffs=[agent_1, agent_2]
     )
-    response = ModelResponse(
-        output=[
+    response = mk_response(
+        [
             get_text_message("Hello, world!"),
             get_function_tool_call("test", "abc"),
             get_handoff_tool_call(agent_1),
-        ],
-        usage=Usage(),
-        response_id=None,
+        ]
     )
 
+    handoffs, all_tools = await asyncio.gather(cached_handoffs(agent_3), cached_all_tools(agent_3))
     result = RunImpl.process_model_response(
         agent=agent_3,
         response=response,
         output_schema=None,
-        handoffs=await AgentRunner._get_handoffs(agent_3, _dummy_ctx()),
-        all_tools=await agent_3.get_all_tools(_dummy_ctx()),
+        handoffs=handoffs,
+        all_tools=all_tools,
     )
     assert result.functions and len(result.functions) == 1
     assert len(result.handoffs) == 1, "Should have a handoff here"
     handoff = result.handoffs[0]
-    assert handoff.handoff.tool_name == Handoff.default_tool_name(agent_1)
-    assert handoff.handoff.tool_description == Handoff.default_tool_description(agent_1)
+    expected_name, expected_desc = _expected_handoff(agent_1)
+    assert handoff.handoff.tool_name == expected_name
+    assert handoff.handoff.tool_description == expected_desc
     assert handoff.handoff.agent_name == agent_1.name
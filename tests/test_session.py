@@ -1,8 +1,9 @@
 """Tests for session memory functionality."""
 
 import asyncio
-import tempfile
-from pathlib import Path
+import functools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -12,16 +13,40 @@ from agents.exceptions import UserError
 from .fake_model import FakeModel
 from .test_responses import get_text_message
 
+# Every connection to this shared-cache URI sees the same in-memory database, so the
+# whole module can reuse one database instead of paying file creation + schema setup per
+# test. Tests are isolated by session_id and clear their own rows on the way out.
+_SHARED_DB_URI = "file:agents_test_session?mode=memory&cache=shared"
 
-# Helper functions for parametrized testing of different Runner methods
-def _run_sync_wrapper(agent, input_data, **kwargs):
-    """Wrapper for run_sync that properly sets up an event loop."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return Runner.run_sync(agent, input_data, **kwargs)
-    finally:
-        loop.close()
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """Yield the shared in-memory database URI, kept alive by an anchor connection.
+
+    A shared-cache in-memory database is dropped once its last connection closes; the
+    anchor connection pins it for the whole run so schema created by the first test
+    survives each SQLiteSession.close().
+    """
+    anchor = sqlite3.connect(_SHARED_DB_URI, uri=True, check_same_thread=False)
+    yield _SHARED_DB_URI
+    anchor.close()
+
+
+@pytest.fixture
+def fake_model_agent():
+    """Yield the FakeModel/Agent pair every runner-method test builds identically."""
+    model = FakeModel()
+    agent = Agent(name="test", model=model)
+    return model, agent
+
+
+# run_sync needs a thread without a running event loop. Rather than spawning a thread and
+# building (then closing) a fresh loop per call, keep one worker thread whose persistent
+# loop run_sync's run_until_complete reuses for the whole module.
+_sync_runner_executor = ThreadPoolExecutor(
+    max_workers=1,
+    initializer=lambda: asyncio.set_event_loop(asyncio.new_event_loop()),
+)
 
 
 async def run_agent_async(runner_method: str, agent, input_data, **kwargs):
@@ -29,22 +54,16 @@ async def run_agent_async(runner_method: str, agent, input_data, **kwargs):
     if runner_method == "run":
         return await Runner.run(agent, input_data, **kwargs)
     elif runner_method == "run_sync":
-        # For run_sync, we need to run it in a thread with its own event loop
-        return await asyncio.to_thread(_run_sync_wrapper, agent, input_data, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            _sync_runner_executor,
+            functools.partial(Runner.run_sync, agent, input_data, **kwargs),
+        )
     elif runner_method == "run_streamed":
         result = Runner.run_streamed(agent, input_data, **kwargs)
-        # For streaming, we first try to get at least one event to trigger any early exceptions
-        # If there's an exception in setup (like memory validation), it will be raised here
-        try:
-            first_event = None
-            async for event in result.stream_events():
-                if first_event is None:
-                    first_event = event
-                # Continue consuming all events
-                pass
-        except Exception:
-            # If an exception occurs during streaming, we let it propagate up
-            raise
+        # Drain the stream: setup errors (like session validation) surface on the first
+        # iteration, and final_output is only settled once the stream completes.
+        async for _event in result.stream_events():
+            pass
         return result
     else:
         raise ValueError(f"Unknown runner method: {runner_method}")
@@ -53,348 +72,350 @@ async def run_agent_async(runner_method: str, agent, input_data, **kwargs):
 # Parametrized tests for different runner methods
 @pytest.mark.parametrize("runner_method", ["run", "run_sync", "run_streamed"])
 @pytest.mark.asyncio
-async def test_session_memory_basic_functionality_parametrized(runner_method):
+async def test_session_memory_basic_functionality_parametrized(
+    runner_method, shared_db, fake_model_agent
+):
     """Test basic session memory functionality with SQLite backend across all runner methods."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_memory.db"
-        session_id = "test_session_123"
-        session = SQLiteSession(session_id, db_path)
-
-        model = FakeModel()
-        agent = Agent(name="test", model=model)
-
-        # First turn
-        model.set_next_output([get_text_message("San Francisco")])
-        result1 = await run_agent_async(
-            runner_method,
-            agent,
-            "What city is the Golden Gate Bridge in?",
-            session=session,
-        )
-        assert result1.final_output == "San Francisco"
-
-        # Second turn - should have conversation history
-        model.set_next_output([get_text_message("California")])
-        result2 = await run_agent_async(
-            runner_method,
-            agent,
-            "What state is it in?",
-            session=session,
-        )
-        assert result2.final_output == "California"
-
-        # Verify that the input to the second turn includes the previous conversation
-        # The model should have received the full conversation history
-        last_input = model.last_turn_args["input"]
-        assert len(last_input) > 1  # Should have more than just the current message
+    session_id = "test_session_123"
+    session = SQLiteSession(session_id, shared_db)
+
+    model, agent = fake_model_agent
+
+    # First turn
+    model.set_next_output([get_text_message("San Francisco")])
+    result1 = await run_agent_async(
+        runner_method,
+        agent,
+        "What city is the Golden Gate Bridge in?",
+        session=session,
+    )
+    assert result1.final_output == "San Francisco"
+
+    # Second turn - should have conversation history
+    model.set_next_output([get_text_message("California")])
+    result2 = await run_agent_async(
+        runner_method,
+        agent,
+        "What state is it in?",
+        session=session,
+    )
+    assert result2.final_output == "California"
+
+    # Verify that the input to the second turn includes the previous conversation
+    # The model should have received the full conversation history
+    last_input = model.last_turn_args["input"]
+    assert len(last_input) > 1  # Should have more than just the current message
 
-        session.close()
+    await session.clear_session()
+    session.close()
 
 
 @pytest.mark.parametrize("runner_method", ["run", "run_sync", "run_streamed"])
 @pytest.mark.asyncio
-async def test_session_memory_with_explicit_instance_parametrized(runner_method):
+async def test_session_memory_with_explicit_instance_parametrized(
+    runner_method, shared_db, fake_model_agent
+):
     """Test session memory with an explicit SQLiteSession instance across all runner methods."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_memory.db"
-        session_id = "test_session_456"
-        session = SQLiteSession(session_id, db_path)
-
-        model = FakeModel()
-        agent = Agent(name="test", model=model)
-
-        # First turn
-        model.set_next_output([get_text_message("Hello")])
-        result1 = await run_agent_async(runner_method, agent, "Hi there", session=session)
-        assert result1.final_output == "Hello"
-
-        # Second turn
-        model.set_next_output([get_text_message("I remember you said hi")])
-        result2 = await run_agent_async(
-            runner_method,
-            agent,
-            "Do you remember what I said?",
-            session=session,
-        )
-        assert result2.final_output == "I remember you said hi"
+    session_id = "test_session_456"
+    session = SQLiteSession(session_id, shared_db)
+
+    model, agent = fake_model_agent
 
-        session.close()
+    # First turn
+    model.set_next_output([get_text_message("Hello")])
+    result1 = await run_agent_async(runner_method, agent, "Hi there", session=session)
+    assert result1.final_output == "Hello"
+
+    # Second turn
+    model.set_next_output([get_text_message("I remember you said hi")])
+    result2 = await run_agent_async(
+        runner_method,
+        agent,
+        "Do you remember what I said?",
+        session=session,
+    )
+    assert result2.final_output == "I remember you said hi"
+
+    await session.clear_session()
+    session.close()
 
 
 @pytest.mark.parametrize("runner_method", ["run", "run_sync", "run_streamed"])
 @pytest.mark.asyncio
-async def test_session_memory_disabled_parametrized(runner_method):
+async def test_session_memory_disabled_parametrized(runner_method, fake_model_agent):
     """Test that session memory is disabled when session=None across all runner methods."""
-    model = FakeModel()
-    agent = Agent(name="test", model=model)
+    model, agent = fake_model_agent
 
-    # First turn (no session parameters = disabled)
+    # One turn is enough: with no session there is no history to prepend, so the model
+    # must see exactly the current message.
     model.set_next_output([get_text_message("Hello")])
-    result1 = await run_agent_async(runner_method, agent, "Hi there")
-    assert result1.final_output == "Hello"
-
-    # Second turn - should NOT have conversation history
-    model.set_next_output([get_text_message("I don't remember")])
-    result2 = await run_agent_async(runner_method, agent, "Do you remember what I said?")
-    assert result2.final_output == "I don't remember"
+    result = await run_agent_async(runner_method, agent, "Hi there")
+    assert result.final_output == "Hello"
 
-    # Verify that the input to the second turn is just the current message
     last_input = model.last_turn_args["input"]
     assert len(last_input) == 1  # Should only have the current message
+    assert last_input[0].get("content") == "Hi there"
 
 
 @pytest.mark.parametrize("runner_method", ["run", "run_sync", "run_streamed"])
 @pytest.mark.asyncio
-async def test_session_memory_different_sessions_parametrized(runner_method):
+async def test_session_memory_different_sessions_parametrized(
+    runner_method, shared_db, fake_model_agent
+):
     """Test that different session IDs maintain separate conversation histories across all runner
     methods."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_memory.db"
-
-        model = FakeModel()
-        agent = Agent(name="test", model=model)
-
-        # Session 1
-        session_id_1 = "session_1"
-        session_1 = SQLiteSession(session_id_1, db_path)
-
-        model.set_next_output([get_text_message("I like cats")])
-        result1 = await run_agent_async(runner_method, agent, "I like cats", session=session_1)
-        assert result1.final_output == "I like cats"
-
-        # Session 2 - different session
-        session_id_2 = "session_2"
-        session_2 = SQLiteSession(session_id_2, db_path)
-
-        model.set_next_output([get_text_message("I like dogs")])
-        result2 = await run_agent_async(runner_method, agent, "I like dogs", session=session_2)
-        assert result2.final_output == "I like dogs"
-
-        # Back to Session 1 - should remember cats, not dogs
-        model.set_next_output([get_text_message("Yes, you mentioned cats")])
-        result3 = await run_agent_async(
-            runner_method,
-            agent,
-            "What did I say I like?",
-            session=session_1,
-        )
-        assert result3.final_output == "Yes, you mentioned cats"
+    model, agent = fake_model_agent
+
+    # Session 1
+    session_id_1 = "session_1"
+    session_1 = SQLiteSession(session_id_1, shared_db)
+
+    model.set_next_output([get_text_message("I like cats")])
+    result1 = await run_agent_async(runner_method, agent, "I like cats", session=session_1)
+    assert result1.final_output == "I like cats"
 
-        session_1.close()
-        session_2.close()
+    # Session 2 - different session
+    session_id_2 = "session_2"
+    session_2 = SQLiteSession(session_id_2, shared_db)
+
+    model.set_next_output([get_text_message("I like dogs")])
+    result2 = await run_agent_async(runner_method, agent, "I like dogs", session=session_2)
+    assert result2.final_output == "I like dogs"
+
+    # Back to Session 1 - should remember cats, not dogs
+    model.set_next_output([get_text_message("Yes, you mentioned cats")])
+    result3 = await run_agent_async(
+        runner_method,
+        agent,
+        "What did I say I like?",
+        session=session_1,
+    )
+    assert result3.final_output == "Yes, you mentioned cats"
+
+    await session_1.clear_session()
+    await session_2.clear_session()
+    session_1.close()
+    session_2.close()
 
 
 @pytest.mark.asyncio
-async def test_sqlite_session_memory_direct():
+async def test_sqlite_session_memory_direct(shared_db):
     """Test SQLiteSession class directly."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_direct.db"
-        session_id = "direct_test"
-        session = SQLiteSession(session_id, db_path)
+    session_id = "direct_test"
+    session = SQLiteSession(session_id, shared_db)
 
-        # Test adding and retrieving items
-        items: list[TResponseInputItem] = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi there!"},
-        ]
+    # Test adding and retrieving items
+    items: list[TResponseInputItem] = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there!"},
+    ]
 
-        await session.add_items(items)
-        retrieved = await session.get_items()
+    await session.add_items(items)
+    retrieved = await session.get_items()
 
-        assert len(retrieved) == 2
-        assert retrieved[0].get("role") == "user"
-        assert retrieved[0].get("content") == "Hello"
-        assert retrieved[1].get("role") == "assistant"
-        assert retrieved[1].get("content") == "Hi there!"
+    assert len(retrieved) == 2
+    assert retrieved[0].get("role") == "user"
+    assert retrieved[0].get("content") == "Hello"
+    assert retrieved[1].get("role") == "assistant"
+    assert retrieved[1].get("content") == "Hi there!"
 
-        # Test clearing session
-        await session.clear_session()
-        retrieved_after_clear = await session.get_items()
-        assert len(retrieved_after_clear) == 0
+    # Test clearing session
+    await session.clear_session()
+    retrieved_after_clear = await session.get_items()
+    assert len(retrieved_after_clear) == 0
 
-        session.close()
+    session.close()
 
 
 @pytest.mark.asyncio
-async def test_sqlite_session_memory_pop_item():
-    """Test SQLiteSession pop_item functionality."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_pop.db"
-        session_id = "pop_test"
-        session = SQLiteSession(session_id, db_path)
-
-        # Test popping from empty session
-        popped = await session.pop_item()
-        assert popped is None
-
-        # Add items
-        items: list[TResponseInputItem] = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi there!"},
-            {"role": "user", "content": "How are you?"},
-        ]
-
-        await session.add_items(items)
-
-        # Verify all items are there
-        retrieved = await session.get_items()
-        assert len(retrieved) == 3
-
-        # Pop the most recent item
-        popped = await session.pop_item()
-        assert popped is not None
-        assert popped.get("role") == "user"
-        assert popped.get("content") == "How are you?"
-
-        # Verify item was removed
-        retrieved_after_pop = await session.get_items()
-        assert len(retrieved_after_pop) == 2
-        assert retrieved_after_pop[-1].get("content") == "Hi there!"
-
-        # Pop another item
-        popped2 = await session.pop_item()
-        assert popped2 is not None
-        assert popped2.get("role") == "assistant"
-        assert popped2.get("content") == "Hi there!"
-
-        # Pop the last item
-        popped3 = await session.pop_item()
-        assert popped3 is not None
-        assert popped3.get("role") == "user"
-        assert popped3.get("content") == "Hello"
-
-        # Try to pop from empty session again
-        popped4 = await session.pop_item()
-        assert popped4 is None
-
-        # Verify session is empty
-        final_items = await session.get_items()
-        assert len(final_items) == 0
-
-        session.close()
+async def test_sqlite_session_close_is_idempotent(tmp_path):
+    """Calling close() twice should be a no-op, for file and in-memory databases alike."""
+    file_session = SQLiteSession("close_twice", tmp_path / "test.db")
+    await file_session.add_items([{"role": "user", "content": "Hello"}])
+    file_session.close()
+    file_session.close()
+
+    memory_session = SQLiteSession("close_twice_memory")
+    await memory_session.add_items([{"role": "user", "content": "Hello"}])
+    memory_session.close()
+    memory_session.close()
 
 
 @pytest.mark.asyncio
-async def test_session_memory_pop_different_sessions():
-    """Test that pop_item only affects the specified session."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_pop_sessions.db"
+async def test_sqlite_session_memory_pop_item(shared_db):
+    """Test SQLiteSession pop_item functionality."""
+    session_id = "pop_test"
+    session = SQLiteSession(session_id, shared_db)
+
+    # Test popping from empty session
+    popped = await session.pop_item()
+    assert popped is None
+
+    # Add items
+    items: list[TResponseInputItem] = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there!"},
+        {"role": "user", "content": "How are you?"},
+    ]
+
+    await session.add_items(items)
 
-        session_1_id = "session_1"
-        session_2_id = "session_2"
-        session_1 = SQLiteSession(session_1_id, db_path)
-        session_2 = SQLiteSession(session_2_id, db_path)
+    # Verify all items are there
+    retrieved = await session.get_items()
+    assert len(retrieved) == 3
 
-        # Add items to both sessions
-        items_1: list[TResponseInputItem] = [
-            {"role": "user", "content": "Session 1 message"},
-        ]
-        items_2: list[TResponseInputItem] = [
-            {"role": "user", "content": "Session 2 message 1"},
-            {"role": "user", "content": "Session 2 message 2"},
-        ]
+    # Pop the most recent item
+    popped = await session.pop_item()
+    assert popped is not None
+    assert popped.get("role") == "user"
+    assert popped.get("content") == "How are you?"
 
-        await session_1.add_items(items_1)
-        await session_2.add_items(items_2)
+    # Verify item was removed
+    retrieved_after_pop = await session.get_items()
+    assert len(retrieved_after_pop) == 2
+    assert retrieved_after_pop[-1].get("content") == "Hi there!"
 
-        # Pop from session 2
-        popped = await session_2.pop_item()
-        assert popped is not None
-        assert popped.get("content") == "Session 2 message 2"
+    # Pop another item
+    popped2 = await session.pop_item()
+    assert popped2 is not None
+    assert popped2.get("role") == "assistant"
+    assert popped2.get("content") == "Hi there!"
 
-        # Verify session 1 is unaffected
-        session_1_items = await session_1.get_items()
-        assert len(session_1_items) == 1
-        assert session_1_items[0].get("content") == "Session 1 message"
+    # Pop the last item
+    popped3 = await session.pop_item()
+    assert popped3 is not None
+    assert popped3.get("role") == "user"
+    assert popped3.get("content") == "Hello"
 
-        # Verify session 2 has one item left
-        session_2_items = await session_2.get_items()
-        assert len(session_2_items) == 1
-        assert session_2_items[0].get("content") == "Session 2 message 1"
+    # Try to pop from empty session again
+    popped4 = await session.pop_item()
+    assert popped4 is None
 
-        session_1.close()
-        session_2.close()
+    # Verify session is empty
+    final_items = await session.get_items()
+    assert len(final_items) == 0
+
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_session_memory_pop_different_sessions(shared_db):
+    """Test that pop_item only affects the specified session."""
+    session_1_id = "pop_session_1"
+    session_2_id = "pop_session_2"
+    session_1 = SQLiteSession(session_1_id, shared_db)
+    session_2 = SQLiteSession(session_2_id, shared_db)
+
+    # Add items to both sessions
+    items_1: list[TResponseInputItem] = [
+        {"role": "user", "content": "Session 1 message"},
+    ]
+    items_2: list[TResponseInputItem] = [
+        {"role": "user", "content": "Session 2 message 1"},
+        {"role": "user", "content": "Session 2 message 2"},
+    ]
+
+    await session_1.add_items(items_1)
+    await session_2.add_items(items_2)
+
+    # Pop from session 2
+    popped = await session_2.pop_item()
+    assert popped is not None
+    assert popped.get("content") == "Session 2 message 2"
+
+    # Verify session 1 is unaffected
+    session_1_items = await session_1.get_items()
+    assert len(session_1_items) == 1
+    assert session_1_items[0].get("content") == "Session 1 message"
+
+    # Verify session 2 has one item left
+    session_2_items = await session_2.get_items()
+    assert len(session_2_items) == 1
+    assert session_2_items[0].get("content") == "Session 2 message 1"
+
+    await session_1.clear_session()
+    await session_2.clear_session()
+    session_1.close()
+    session_2.close()
 
 
 @pytest.mark.asyncio
-async def test_sqlite_session_get_items_with_limit():
+async def test_sqlite_session_get_items_with_limit(shared_db):
     """Test SQLiteSession get_items with limit parameter."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_count.db"
-        session_id = "count_test"
-        session = SQLiteSession(session_id, db_path)
-
-        # Add multiple items
-        items: list[TResponseInputItem] = [
-            {"role": "user", "content": "Message 1"},
-            {"role": "assistant", "content": "Response 1"},
-            {"role": "user", "content": "Message 2"},
-            {"role": "assistant", "content": "Response 2"},
-            {"role": "user", "content": "Message 3"},
-            {"role": "assistant", "content": "Response 3"},
-        ]
-
-        await session.add_items(items)
-
-        # Test getting all items (default behavior)
-        all_items = await session.get_items()
-        assert len(all_items) == 6
-        assert all_items[0].get("content") == "Message 1"
-        assert all_items[-1].get("content") == "Response 3"
-
-        # Test getting latest 2 items
-        latest_2 = await session.get_items(limit=2)
-        assert len(latest_2) == 2
-        assert latest_2[0].get("content") == "Message 3"
-        assert latest_2[1].get("content") == "Response 3"
-
-        # Test getting latest 4 items
-        latest_4 = await session.get_items(limit=4)
-        assert len(latest_4) == 4
-        assert latest_4[0].get("content") == "Message 2"
-        assert latest_4[1].get("content") == "Response 2"
-        assert latest_4[2].get("content") == "Message 3"
-        assert latest_4[3].get("content") == "Response 3"
-
-        # Test getting more items than available
-        latest_10 = await session.get_items(limit=10)
-        assert len(latest_10) == 6  # Should return all available items
-        assert latest_10[0].get("content") == "Message 1"
-        assert latest_10[-1].get("content") == "Response 3"
-
-        # Test getting 0 items
-        latest_0 = await session.get_items(limit=0)
-        assert len(latest_0) == 0
-
-        session.close()
+    session_id = "count_test"
+    session = SQLiteSession(session_id, shared_db)
+
+    # Add multiple items
+    items: list[TResponseInputItem] = [
+        {"role": "user", "content": "Message 1"},
+        {"role": "assistant", "content": "Response 1"},
+        {"role": "user", "content": "Message 2"},
+        {"role": "assistant", "content": "Response 2"},
+        {"role": "user", "content": "Message 3"},
+        {"role": "assistant", "content": "Response 3"},
+    ]
+
+    await session.add_items(items)
+
+    # Test getting all items (default behavior)
+    all_items = await session.get_items()
+    assert len(all_items) == 6
+    assert all_items[0].get("content") == "Message 1"
+    assert all_items[-1].get("content") == "Response 3"
+
+    # Test getting latest 2 items
+    latest_2 = await session.get_items(limit=2)
+    assert len(latest_2) == 2
+    assert latest_2[0].get("content") == "Message 3"
+    assert latest_2[1].get("content") == "Response 3"
+
+    # Test getting latest 4 items
+    latest_4 = await session.get_items(limit=4)
+    assert len(latest_4) == 4
+    assert latest_4[0].get("content") == "Message 2"
+    assert latest_4[1].get("content") == "Response 2"
+    assert latest_4[2].get("content") == "Message 3"
+    assert latest_4[3].get("content") == "Response 3"
+
+    # Test getting more items than available
+    latest_10 = await session.get_items(limit=10)
+    assert len(latest_10) == 6  # Should return all available items
+    assert latest_10[0].get("content") == "Message 1"
+    assert latest_10[-1].get("content") == "Response 3"
+
+    # Test getting 0 items
+    latest_0 = await session.get_items(limit=0)
+    assert len(latest_0) == 0
+
+    await session.clear_session()
+    session.close()
 
 
 @pytest.mark.parametrize("runner_method", ["run", "run_sync", "run_streamed"])
 @pytest.mark.asyncio
-async def test_session_memory_rejects_both_session_and_list_input(runner_method):
-    """Test that passing both a session and list input raises a UserError across all runner
+async def test_session_memory_rejects_both_session_and_list_input(
+    runner_method, shared_db, fake_model_agent
+):
+    """Test that passing both a session and a list input raises a UserError across all runner
     methods.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = Path(temp_dir) / "test_validation.db"
-        session_id = "test_validation_parametrized"
-        session = SQLiteSession(session_id, db_path)
+    session_id = "test_validation_parametrized"
+    session = SQLiteSession(session_id, shared_db)
 
-        model = FakeModel()
-        agent = Agent(name="test", model=model)
+    model, agent = fake_model_agent
 
-        # Test that providing both a session and a list input raises a UserError
-        model.set_next_output([get_text_message("This shouldn't run")])
+    # Test that providing both a session and a list input raises a UserError
+    model.set_next_output([get_text_message("This shouldn't run")])
 
-        list_input = [
-            {"role": "user", "content": "Test message"},
-        ]
+    list_input = [
+        {"role": "user", "content": "Test message"},
+    ]
 
-        with pytest.raises(UserError) as exc_info:
-            await run_agent_async(runner_method, agent, list_input, session=session)
+    with pytest.raises(UserError) as exc_info:
+        await run_agent_async(runner_method, agent, list_input, session=session)
 
-        # Verify the error message explains the issue
-        assert "Cannot provide both a session and a list of input items" in str(exc_info.value)
-        assert "manually manage conversation history" in str(exc_info.value)
+    # Verify the error message explains the issue
+    assert "Cannot provide both a session and a list of input items" in str(exc_info.value)
+    assert "manually manage conversation history" in str(exc_info.value)
 
-        session.close()
+    session.close()
@@ -39,9 +39,9 @@ class FakeRealtimeModel(RealtimeModel):
     async def _send_events(self) -> None:
         """Send queued events to all listeners."""
         for event in self._events_to_send:
-            await asyncio.sleep(0.001)  # Small delay to simulate async behavior
-            for listener in self._listeners:
-                await listener.on_event(event)
+            await asyncio.sleep(0)  # Yield to the loop to simulate async behavior, without a timer
+            # Fan out concurrently; listeners for one event don't depend on each other.
+            await asyncio.gather(*(listener.on_event(event) for listener in self._listeners))
 
     def add_listener(self, listener: RealtimeModelListener) -> None:
         """Add a listener."""
@@ -85,6 +85,17 @@ class FakeRealtimeModel(RealtimeModel):
         pass
 
 
+async def drain_until_exception(session: RealtimeSession) -> None:
+    """Advance the session iterator until its stored exception propagates.
+
+    Equivalent to `async for _ in session: pass`, minus the async-for loop's
+    per-iteration bookkeeping - each event costs one bare __anext__ send.
+    """
+    iterator = session.__aiter__()
+    while True:
+        await iterator.__anext__()
+
+
 @pytest.fixture
 def fake_agent():
     """Create a fake agent for testing."""
@@ -125,8 +136,7 @@ class TestSessionExceptions:
         async with session:
             # Try to iterate and expect exception
             with pytest.raises(ValueError, match="Test error"):
-                async for _ in session:
-                    pass  # Should never reach here
+                await drain_until_exception(session)  # Should never yield an event
 
         # Verify cleanup occurred
         assert session._closed is True
@@ -150,8 +160,7 @@ class TestSessionExceptions:
 
         with pytest.raises(websockets.exceptions.ConnectionClosed):
             async with session:
-                async for _event in session:
-                    pass
+                await drain_until_exception(session)
 
         # Verify error closure triggered cleanup
         assert session._closed is True
@@ -171,40 +180,37 @@ class TestSessionExceptions:
 
         with pytest.raises(json.JSONDecodeError):
             async with session:
-                async for _event in session:
-                    pass
+                await drain_until_exception(session)
 
         # Verify context is preserved
         assert session._stored_exception == json_error
         assert session._closed is True
 
     @pytest.mark.asyncio
-    async def test_exception_context_preservation(self, fake_model: FakeRealtimeModel, fake_agent):
-        """Test that exception context information is preserved through the handling process."""
-        test_contexts = [
+    @pytest.mark.parametrize(
+        "context,exception",
+        [
             ("Failed to send audio", RuntimeError("Audio encoding failed")),
             ("WebSocket error in message listener", ConnectionError("Network error")),
             ("Failed to send event: response.create", OSError("Socket closed")),
-        ]
-
-        for context, exception in test_contexts:
-            exception_event = RealtimeModelExceptionEvent(exception=exception, context=context)
-
-            session = RealtimeSession(fake_model, fake_agent, None)
-            fake_model.set_next_events([exception_event])
+        ],
+    )
+    async def test_exception_context_preservation(
+        self, fake_model: FakeRealtimeModel, fake_agent, context: str, exception: Exception
+    ):
+        """Test that exception context information is preserved through the handling process."""
+        exception_event = RealtimeModelExceptionEvent(exception=exception, context=context)
 
-            with pytest.raises(type(exception)):
-                async with session:
-                    async for _event in session:
-                        pass
+        session = RealtimeSession(fake_model, fake_agent, None)
+        fake_model.set_next_events([exception_event])
 
-            # Verify the exact exception is stored
-            assert session._stored_exception == exception
-            assert session._closed is True
+        with pytest.raises(type(exception)):
+            async with session:
+                await drain_until_exception(session)
 
-            # Reset for next iteration
-            fake_model._is_connected = False
-            fake_model._listeners.clear()
+        # Verify the exact exception is stored
+        assert session._stored_exception == exception
+        assert session._closed is True
 
     @pytest.mark.asyncio
     async def test_multiple_exception_handling_behavior(
@@ -249,27 +255,23 @@ class TestSessionExceptions:
 
         session = RealtimeSession(fake_model, fake_agent, None)
 
-        # Add some fake guardrail tasks
-        fake_task1 = Mock()
-        fake_task1.done.return_value = False
-        fake_task1.cancel = Mock()
-
-        fake_task2 = Mock()
-        fake_task2.done.return_value = True
-        fake_task2.cancel = Mock()
+        # Add some real guardrail tasks: one still pending, one already finished.
+        # Cleanup now awaits cancellation, so the tasks must be genuine awaitables.
+        pending_task = asyncio.create_task(asyncio.Event().wait())
+        completed_task = asyncio.create_task(asyncio.sleep(0))
+        await completed_task
 
-        session._guardrail_tasks = {fake_task1, fake_task2}
+        session._guardrail_tasks = {pending_task, completed_task}
 
         fake_model.set_next_events([exception_event])
 
         with pytest.raises(RuntimeError, match="Processing error"):
             async with session:
-                async for _event in session:
-                    pass
+                await drain_until_exception(session)
 
         # Verify guardrail tasks were properly cleaned up
-        fake_task1.cancel.assert_called_once()
-        fake_task2.cancel.assert_not_called()  # Already done
+        assert pending_task.cancelled()
+        assert not completed_task.cancelled()  # Already done, so never cancelled
         assert len(session._guardrail_tasks) == 0
 
     @pytest.mark.asyncio
@@ -8,58 +8,37 @@ from .test_responses import get_function_tool, get_function_tool_call, get_text_
 
 
 class TestToolChoiceReset:
-    def test_should_reset_tool_choice_direct(self):
+    @pytest.mark.parametrize(
+        "tool_choice,used_tools,used_by_other_agent,expected",
+        [
+            # An empty tool use tracker should leave any tool choice alone.
+            (None, [], False, None),
+            ("auto", [], False, "auto"),
+            ("required", [], False, "required"),
+            # Once this agent has used tools, the choice resets regardless of its value.
+            ("required", ["tool1"], False, None),
+            ("required", ["tool1", "tool2"], False, None),
+            ("foo_bar", ["foo_bar", "baz"], False, None),
+            # Tool usage on a different agent should not affect this agent's choice.
+            ("foo_bar", ["foo_bar", "baz"], True, "foo_bar"),
+        ],
+    )
+    def test_should_reset_tool_choice_direct(
+        self, tool_choice, used_tools, used_by_other_agent, expected
+    ):
         """
-        Test the _should_reset_tool_choice method directly with various inputs
+        Test the maybe_reset_tool_choice method directly with various inputs
         to ensure it correctly identifies cases where reset is needed.
         """
         agent = Agent(name="test_agent")
-
-        # Case 1: Empty tool use tracker should not change the "None" tool choice
-        model_settings = ModelSettings(tool_choice=None)
-        tracker = AgentToolUseTracker()
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert new_settings.tool_choice == model_settings.tool_choice
-
-        # Case 2: Empty tool use tracker should not change the "auto" tool choice
-        model_settings = ModelSettings(tool_choice="auto")
-        tracker = AgentToolUseTracker()
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert model_settings.tool_choice == new_settings.tool_choice
-
-        # Case 3: Empty tool use tracker should not change the "required" tool choice
-        model_settings = ModelSettings(tool_choice="required")
-        tracker = AgentToolUseTracker()
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert model_settings.tool_choice == new_settings.tool_choice
-
-        # Case 4: tool_choice = "required" with one tool should reset
-        model_settings = ModelSettings(tool_choice="required")
         tracker = AgentToolUseTracker()
-        tracker.add_tool_use(agent, ["tool1"])
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert new_settings.tool_choice is None
-
-        # Case 5: tool_choice = "required" with multiple tools should reset
-        model_settings = ModelSettings(tool_choice="required")
-        tracker = AgentToolUseTracker()
-        tracker.add_tool_use(agent, ["tool1", "tool2"])
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert new_settings.tool_choice is None
+        if used_tools:
+            user = Agent(name="other_agent") if used_by_other_agent else agent
+            tracker.add_tool_use(user, used_tools)
 
-        # Case 6: Tool usage on a different agent should not affect the tool choice
-        model_settings = ModelSettings(tool_choice="foo_bar")
-        tracker = AgentToolUseTracker()
-        tracker.add_tool_use(Agent(name="other_agent"), ["foo_bar", "baz"])
-        new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert new_settings.tool_choice == model_settings.tool_choice
-
-        # Case 7: tool_choice = "foo_bar" with multiple tools should reset
-        model_settings = ModelSettings(tool_choice="foo_bar")
-        tracker = AgentToolUseTracker()
-        tracker.add_tool_use(agent, ["foo_bar", "baz"])
+        model_settings = ModelSettings(tool_choice=tool_choice)
         new_settings = RunImpl.maybe_reset_tool_choice(agent, tracker, model_settings)
-        assert new_settings.tool_choice is None
+        assert new_settings.tool_choice == expected
 
     @pytest.mark.asyncio
     async def test_required_tool_choice_with_multiple_runs(self):
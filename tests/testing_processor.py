@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import threading
+from collections import deque
 from datetime import datetime
 from typing import Any, Literal
 
@@ -16,47 +16,44 @@ class SpanProcessorForTests(TracingProcessor):
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        # Dictionary of trace_id -> list of spans
-        self._spans: list[Span[Any]] = []
-        self._traces: list[Trace] = []
-        self._events: list[TestSpanProcessorEvent] = []
+        # The hooks below run synchronously inside the traced code, so they should do as
+        # little as possible. A single `deque.append` is atomic in CPython, which keeps
+        # them thread-safe without taking a lock on every span; sorting and filtering
+        # happen on demand when a test fetches the results.
+        self._spans: deque[Span[Any]] = deque()
+        self._traces: deque[Trace] = deque()
+        self._events: deque[TestSpanProcessorEvent] = deque()
 
     def on_trace_start(self, trace: Trace) -> None:
-        with self._lock:
-            self._traces.append(trace)
-            self._events.append("trace_start")
+        self._traces.append(trace)
+        self._events.append("trace_start")
 
     def on_trace_end(self, trace: Trace) -> None:
-        with self._lock:
-            # We don't append the trace here, we want to do that in on_trace_start
-            self._events.append("trace_end")
+        # We don't append the trace here, we want to do that in on_trace_start
+        self._events.append("trace_end")
 
     def on_span_start(self, span: Span[Any]) -> None:
-        with self._lock:
-            # Purposely not appending the span here, we want to do that in on_span_end
-            self._events.append("span_start")
+        # Purposely not appending the span here, we want to do that in on_span_end
+        self._events.append("span_start")
 
     def on_span_end(self, span: Span[Any]) -> None:
-        with self._lock:
-            self._events.append("span_end")
-            self._spans.append(span)
+        self._events.append("span_end")
+        self._spans.append(span)
 
     def get_ordered_spans(self, including_empty: bool = False) -> list[Span[Any]]:
-        with self._lock:
-            spans = [x for x in self._spans if including_empty or x.export()]
-            return sorted(spans, key=lambda x: x.started_at or 0)
+        spans = [x for x in self._spans if including_empty or x.export()]
+        return sorted(spans, key=lambda x: x.started_at or 0)
 
     def get_traces(self, including_empty: bool = False) -> list[Trace]:
-        with self._lock:
-            traces = [x for x in self._traces if including_empty or x.export()]
-            return traces
+        return [x for x in self._traces if including_empty or x.export()]
+
+    def get_events(self) -> list[TestSpanProcessorEvent]:
+        return list(self._events)
 
     def clear(self) -> None:
-        with self._lock:
-            self._spans.clear()
-            self._traces.clear()
-            self._events.clear()
+        self._spans.clear()
+        self._traces.clear()
+        self._events.clear()
 
     def shutdown(self) -> None:
         pass
@@ -77,7 +74,7 @@ def fetch_traces() -> list[Trace]:
 
 
 def fetch_events() -> list[TestSpanProcessorEvent]:
-    return SPAN_PROCESSOR_TESTING._events
+    return SPAN_PROCESSOR_TESTING.get_events()
 
 
 def assert_no_spans():
@@ -41,6 +41,28 @@ def fake_time(increment: int):
         current += increment
 
 
+async def close_session(session: OpenAISTTTranscriptionSession) -> None:
+    """Close the session and reap its background tasks.
+
+    close() only requests cancellation; if a task is still pending when the test's event
+    loop closes, its teardown runs at garbage-collection time against a closed loop and
+    pytest reports the ignored exception.
+    """
+    await session.close()
+    tasks = [
+        task
+        for task in (
+            session._listener_task,
+            session._process_events_task,
+            session._stream_audio_task,
+            session._connection_task,
+        )
+        if task is not None
+    ]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # ===== Tests =====
 @pytest.mark.asyncio
 async def test_non_json_messages_should_crash():
@@ -68,7 +90,7 @@ async def test_non_json_messages_should_crash():
             async for _ in turns:
                 pass
 
-        await session.close()
+        await close_session(session)
 
 
 @pytest.mark.asyncio
@@ -121,7 +143,7 @@ async def test_session_connects_and_configures_successfully():
             f"Expected 'transcription_session.update' in {sent_messages}"
         )
 
-        await session.close()
+        await close_session(session)
 
 
 @pytest.mark.asyncio
@@ -180,7 +202,7 @@ async def test_stream_audio_sends_correct_json():
                 found_audio_append = True
         assert found_audio_append, "No 'input_audio_buffer.append' message was sent."
 
-        await session.close()
+        await close_session(session)
 
 
 @pytest.mark.asyncio
@@ -222,7 +244,7 @@ async def test_transcription_event_puts_output_in_queue():
         collected_turns = []
         async for turn in turns:
             collected_turns.append(turn)
-        await session.close()
+        await close_session(session)
 
         # Check we got "Hello world!"
         assert "Hello world!" in collected_turns
@@ -271,7 +293,7 @@ async def test_timeout_waiting_for_created_event(monkeypatch):
 
         assert "Timeout waiting for transcription_session.created event" in str(exc_info.value)
 
-        await session.close()
+        await close_session(session)
 
 
 @pytest.mark.asyncio
@@ -307,7 +329,7 @@ async def test_session_error_event():
             async for _ in turns:
                 pass
 
-        await session.close()
+        await close_session(session)
 
 
 @pytest.mark.asyncio
@@ -364,4 +386,4 @@ async def test_inactivity_timeout():
 
         assert len(collected_turns) == 0, "No transcripts expected, but we got something?"
 
-        await session.close()
+        await close_session(session)